@@ -0,0 +1,68 @@
+import random
+import timeit
+import tracemalloc
+from typing import List, Tuple
+
+from src.models.knapsack import BoundedKnapsack
+
+
+CAPACITY = 2_000
+ITEMS = 5
+COPIES = [1, 2, 4, 8, 16, 32, 64]
+REPEAT = 3
+
+MEMORY_CAPACITY = 50_000
+MEMORY_COPIES = 8
+
+
+def generate_instance(
+    copies: int, 
+    capacity: int = CAPACITY, 
+    seed: int = 2024
+) -> Tuple[List[int], List[float], List[int], int]:
+    generator = random.Random(seed)
+    weights = [generator.randint(1, 20) for _ in range(ITEMS)]
+    profits = [float(generator.randint(1_000, 100_000)) for _ in range(ITEMS)]
+    return weights, profits, [copies] * ITEMS, capacity
+
+
+def measure(copies: int, engine: str, strategy: str) -> float:
+    instance = generate_instance(copies)
+    timer = timeit.Timer(lambda: BoundedKnapsack._solve_counts(*instance, engine, strategy))
+    return min(timer.repeat(repeat=REPEAT, number=1))
+
+
+def measure_memory(engine: str, strategy: str) -> int:
+    instance = generate_instance(MEMORY_COPIES, MEMORY_CAPACITY)
+    tracemalloc.start()
+    BoundedKnapsack._solve_counts(*instance, engine, strategy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    pairs = [(engine, strategy) \
+        for engine in BoundedKnapsack.ENGINES \
+            for strategy in BoundedKnapsack.STRATEGIES]
+    
+    header = "copies".rjust(8) + "".join(f"{engine}/{strategy}".rjust(20) for engine, strategy in pairs)
+    print(f"Ограниченный рюкзак: {ITEMS} типов зданий, W = {CAPACITY}, время в мс")
+    print(header)
+    for copies in COPIES:
+        row = str(copies).rjust(8)
+        for engine, strategy in pairs:
+            row += f"{measure(copies, engine, strategy) * 1000:20.2f}"
+        print(row)
+    
+    print()
+    print(f"Пиковая память: copies = {MEMORY_COPIES}, W = {MEMORY_CAPACITY}, КиБ")
+    print(" " * 8 + "".join(f"{engine}/{strategy}".rjust(20) for engine, strategy in pairs))
+    row = " " * 8
+    for engine, strategy in pairs:
+        row += f"{measure_memory(engine, strategy) / 1024:20.0f}"
+    print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import sys
+import math
+import random
+import timeit
+from typing import Dict, List
+
+from src.models.placement import Block, GuillotineTree, Rect
+
+
+BLOCKS = [10, 50, 200]
+REPEAT = 3
+
+# Обе стороны замера используют одинаковый алгоритм: гильотинное
+# дерево GuillotineTree и один и тот же проход MaxRects. Отличается
+# только представление блоков и свободных прямоугольников
+
+
+def generate_blocks(amount: int, seed: int = 2024) -> List[Block]:
+    # Порядок по убыванию высоты, как у sort_blocks_by_height: иначе
+    # жадный проход по дереву обрывается на первых блоках
+    generator = random.Random(seed)
+    blocks = [
+        Block(f"Здание {i % 5}", 5, generator.randint(20, 120), generator.randint(20, 120)) \
+            for i in range(amount)
+    ]
+    return sorted(blocks, key=lambda block: block.height, reverse=True)
+
+
+def get_side(blocks: List[Block]) -> int:
+    return math.ceil(math.sqrt(2 * sum(block.area for block in blocks))) + 120
+
+
+def to_dicts(blocks: List[Block]) -> List[Dict]:
+    return [block._asdict() for block in blocks]
+
+
+# ------------------- Гильотинное дерево ---------------------------
+
+def dict_tree_fittable(side: int, blocks: List[Dict]) -> List:
+    tree, placements = GuillotineTree(side, side), list()
+    for block in blocks:
+        node = tree.find(block['width'], block['height'])
+        if node == GuillotineTree.NO_NODE:
+            return list()
+        tree.split(node, block['width'], block['height'])
+        placements.append((block['title'], block['indent'], block['width'], block['height'], tree.x[node], tree.y[node]))
+    return placements
+
+
+def compact_tree_fittable(side: int, blocks: List[Block]) -> List:
+    tree, placements = GuillotineTree(side, side), list()
+    for block in blocks:
+        node = tree.find(block.width, block.height)
+        if node == GuillotineTree.NO_NODE:
+            return list()
+        tree.split(node, block.width, block.height)
+        placements.append((block.title, block.indent, block.width, block.height, tree.x[node], tree.y[node]))
+    return placements
+
+
+# ------------------- Свободные прямоугольники ---------------------------
+
+def dict_split(free: Dict, x: int, y: int, width: int, height: int) -> List[Dict]:
+    if x >= free['x'] + free['width'] or x + width <= free['x'] or \
+        y >= free['y'] + free['height'] or y + height <= free['y']:
+        return [free]
+    result = list()
+    if x > free['x']:
+        result.append({'x': free['x'], 'y': free['y'], 'width': x - free['x'], 'height': free['height']})
+    if x + width < free['x'] + free['width']:
+        result.append({'x': x + width, 'y': free['y'], 'width': free['x'] + free['width'] - x - width, 'height': free['height']})
+    if y > free['y']:
+        result.append({'x': free['x'], 'y': free['y'], 'width': free['width'], 'height': y - free['y']})
+    if y + height < free['y'] + free['height']:
+        result.append({'x': free['x'], 'y': y + height, 'width': free['width'], 'height': free['y'] + free['height'] - y - height})
+    return result
+
+
+def dict_contains(outer: Dict, inner: Dict) -> bool:
+    return outer['x'] <= inner['x'] and outer['y'] <= inner['y'] and \
+        inner['x'] + inner['width'] <= outer['x'] + outer['width'] and \
+            inner['y'] + inner['height'] <= outer['y'] + outer['height']
+
+
+def dict_rects_fittable(side: int, blocks: List[Dict]) -> List:
+    free_rects, placements = [{'x': 0, 'y': 0, 'width': side, 'height': side}], list()
+    for block in blocks:
+        best = None
+        for free in free_rects:
+            if block['width'] <= free['width'] and block['height'] <= free['height'] and \
+                (best is None or (free['y'], free['x']) < (best['y'], best['x'])):
+                best = free
+        if best is None:
+            return list()
+        x, y = best['x'], best['y']
+        split = list()
+        for free in free_rects:
+            split.extend(dict_split(free, x, y, block['width'], block['height']))
+        split = list({(free['x'], free['y'], free['width'], free['height']): free for free in split}.values())
+        free_rects = [
+            free for i, free in enumerate(split) \
+                if not any(j != i and dict_contains(other, free) for j, other in enumerate(split))
+        ]
+        placements.append((block['title'], block['indent'], block['width'], block['height'], x, y))
+    return placements
+
+
+def compact_split(free: Rect, x: int, y: int, width: int, height: int) -> List[Rect]:
+    if x >= free.x + free.width or x + width <= free.x or \
+        y >= free.y + free.height or y + height <= free.y:
+        return [free]
+    result = list()
+    if x > free.x:
+        result.append(Rect(free.x, free.y, x - free.x, free.height))
+    if x + width < free.x + free.width:
+        result.append(Rect(x + width, free.y, free.x + free.width - x - width, free.height))
+    if y > free.y:
+        result.append(Rect(free.x, free.y, free.width, y - free.y))
+    if y + height < free.y + free.height:
+        result.append(Rect(free.x, y + height, free.width, free.y + free.height - y - height))
+    return result
+
+
+def compact_contains(outer: Rect, inner: Rect) -> bool:
+    return outer.x <= inner.x and outer.y <= inner.y and \
+        inner.x + inner.width <= outer.x + outer.width and \
+            inner.y + inner.height <= outer.y + outer.height
+
+
+def compact_rects_fittable(side: int, blocks: List[Block]) -> List:
+    free_rects, placements = [Rect(0, 0, side, side)], list()
+    for block in blocks:
+        best = None
+        for free in free_rects:
+            if block.width <= free.width and block.height <= free.height and \
+                (best is None or (free.y, free.x) < (best.y, best.x)):
+                best = free
+        if best is None:
+            return list()
+        x, y = best.x, best.y
+        split = list()
+        for free in free_rects:
+            split.extend(compact_split(free, x, y, block.width, block.height))
+        split = list(dict.fromkeys(split))
+        free_rects = [
+            free for i, free in enumerate(split) \
+                if not any(j != i and compact_contains(other, free) for j, other in enumerate(split))
+        ]
+        placements.append((block.title, block.indent, block.width, block.height, x, y))
+    return placements
+
+
+# ------------------- Замеры ---------------------------
+
+def measure(function, side: int, blocks: List) -> float:
+    timer = timeit.Timer(lambda: function(side, blocks))
+    return min(timer.repeat(repeat=REPEAT, number=1))
+
+
+def measure_memory(blocks: List) -> int:
+    return sys.getsizeof(blocks) + sum(sys.getsizeof(block) for block in blocks)
+
+
+def print_times(title: str, dict_function, compact_function) -> None:
+    print(title)
+    print("blocks".rjust(8) + "dict".rjust(14) + "compact".rjust(14))
+    for amount in BLOCKS:
+        blocks = generate_blocks(amount)
+        side, dicts = get_side(blocks), to_dicts(blocks)
+        placements = compact_function(side, blocks)
+        assert len(placements) == amount and dict_function(side, dicts) == placements
+        print(
+            str(amount).rjust(8) +
+            f"{measure(dict_function, side, dicts) * 1000:14.2f}" +
+            f"{measure(compact_function, side, blocks) * 1000:14.2f}"
+        )
+
+
+def main() -> None:
+    print_times("Гильотинное дерево: время одного прохода, мс", dict_tree_fittable, compact_tree_fittable)
+    print()
+    print_times("Свободные прямоугольники MaxRects: время одного прохода, мс", dict_rects_fittable, compact_rects_fittable)
+
+    print()
+    print("Память под список блоков без учёта строк, КиБ")
+    print("blocks".rjust(8) + "dict".rjust(14) + "compact".rjust(14))
+    for amount in BLOCKS:
+        blocks = generate_blocks(amount)
+        dicts, compact = measure_memory(to_dicts(blocks)), measure_memory(blocks)
+        print(str(amount).rjust(8) + f"{dicts / 1024:14.1f}" + f"{compact / 1024:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
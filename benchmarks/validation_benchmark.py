@@ -0,0 +1,80 @@
+import timeit
+import operator
+
+from src import _validation_operation, Real
+from src import Surface, Length, Meter, Price, Ruble
+from src import School, Hospital, Kindergarten
+from src.models.knapsack import BoundedKnapsack
+from src.validators import ValidationCounter, validation_disabled
+
+
+SIDES = [150, 200, 250, 300]
+BUDGET = 10_000_000_000
+REPEAT = 3
+OPERATIONS = 10_000
+
+
+def generate_instance(side: int):
+    surface = Surface(Length(side), Meter(side))
+    buildings = [
+        School(length=Meter(40), width=Meter(70)), 
+        Hospital(length=Meter(50), width=Meter(60)), 
+        Kindergarten(length=Meter(50), width=Meter(40)),
+    ]
+    return surface.area, buildings, Price(Ruble(BUDGET), "Бюджет")
+
+
+def measure(side: int):
+    instance = generate_instance(side)
+    with ValidationCounter() as counter:
+        BoundedKnapsack.solve_dynamic(*instance)
+    timer = timeit.Timer(lambda: BoundedKnapsack.solve_dynamic(*instance))
+    return counter, min(timer.repeat(repeat=REPEAT, number=1))
+
+
+def measure_trusted(side: int) -> float:
+    instance = generate_instance(side)
+    
+    def solve() -> None:
+        with validation_disabled():
+            BoundedKnapsack.solve_dynamic(*instance)
+    
+    return min(timeit.Timer(solve).repeat(repeat=REPEAT, number=1))
+
+
+def measure_real_operations():
+    right, left = Real(7), Real(2.5)
+    
+    def validated() -> None:
+        Real(_validation_operation(right, left, operator.add, Real))
+        Real(_validation_operation(right, 3, operator.mul, Real))
+        _validation_operation(right, left, operator.lt, Real)
+    
+    def fast() -> None:
+        right + left
+        right * 3
+        right < left
+    
+    return [
+        (name, min(timeit.Timer(function).repeat(repeat=REPEAT, number=OPERATIONS))) \
+            for name, function in (("validated", validated), ("fast", fast))
+    ]
+
+
+def main() -> None:
+    print("Вызовы валидаторов на одно решение рюкзака")
+    print("side".rjust(8) + "calls".rjust(10) + "time, мс".rjust(12) + "trusted, мс".rjust(14) + "  по валидаторам")
+    for side in SIDES:
+        counter, time = measure(side)
+        trusted = measure_trusted(side)
+        details = ", ".join(f"{name}: {calls}" for name, calls in counter.calls.most_common())
+        print(str(side).rjust(8) + str(counter.total).rjust(10) + f"{time * 1000:12.2f}" + f"{trusted * 1000:14.2f}" + f"  {details}")
+    
+    print()
+    print(f"Real: {OPERATIONS} раз сложение, умножение на int и сравнение, мс")
+    for name, time in measure_real_operations():
+        print(name.rjust(10) + f"{time * 1000:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,7 @@ from src import Flat, Price, PriceFactoryMethod, FlatFactoryMethod, FlatBuilder
 from src import PavilionFactoryMethod, Shop
 from src import Surface, Building, Apartment, School, Hospital, Pavilion
 
-from src import BoundedKnapsack, Binpacker, Kindergarten
+from src import BoundedKnapsack, Binpacker, Kindergarten, PlacementPlanner
 from src import _get_pretty_number
 
 import sys
@@ -77,31 +77,10 @@ def main() -> None:
     
     # print("=" * 100)
     
-    # solution = BoundedKnapsack.solve_dynamic(surface.area, buildings, budget)
+    # solution, packer = PlacementPlanner(surface).plan(buildings, budget)
     # for item in solution:
     #     print(item)
     
-    # print("=" * 100)
-    
-    # pacher = Binpacker(int(surface.width), int(surface.length))
-    # while True:
-    #     if pacher.fit_blocks(solution):
-    #         print(pacher.plot_packing())
-    #         break
-        
-    #     if not isinstance(solution[-1], Apartment | Shop):
-    #         print("\n\tНевозможно расположить даже требуемые объекты!\n")
-    #         break
-    #     else:
-    #         minimum = solution[-1].profit
-            
-    #     index = 0
-    #     for i, building in enumerate(solution):
-    #         if isinstance(building, Apartment | Shop) and building.profit <= minimum:
-    #             index = i
-    #             minimum = building.profit
-    #     solution = solution[:index] + solution[index + 1:]
-    
     # profit = 0
     # price_to_build = 0
     # price_to_build_choose = 0
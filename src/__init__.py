@@ -51,11 +51,13 @@ def _validate(
     left_type: Type | Union[Type],
     operator: operator
 ) -> None:
-    message = _type_error(right, left, operator)
+    if not is_validation_enabled():
+        return
+    count_validation("_validate")
     if not isinstance(right, right_type):
-        raise TypeError(_error(left, message))
+        raise TypeError(_error(left, _type_error(right, left, operator)))
     if not isinstance(left, left_type):
-        raise TypeError(_error(right, message))
+        raise TypeError(_error(right, _type_error(right, left, operator)))
     
 def _operate(
     right: object, 
@@ -3,20 +3,16 @@ from ..constants import DEFAULT_PLURAL_FORM
 from ..measurement import DEFAULT_FORMS
 from ..models.buildings import Building
 from ..measurement.money import Money
-from ..measurement.length import Length, Meter
+from ..measurement.length import Length
 
 def _find_money_type(text: str) -> Money:
-    return next((subclass \
-        for subclass in (Money.__subclasses__() + [Money]) \
-            if subclass.FULL_FORM == text), None)
+    return Money.find_type(text)
 
 def _find_money_form(value: object, text: str) -> str:
     return _format_plural_form(value, _find_money_type(text).PLURAL_MONEY_FORMS)
 
 def _find_length_type(text: str) -> Length:
-    return next((subclass \
-        for subclass in (Meter.__subclasses__() + [Length, Meter]) \
-            if subclass.FULL_FORM == text), None)
+    return Length.find_type(text)
 
 def _find_length_form(value: object, text: str) -> str:
     forms = DEFAULT_FORMS
@@ -8,7 +8,7 @@ from .custom_label import CustomLabel
 from .align_delegate import AlignDelegate
 
 from ..measurement.money import Money
-from ..measurement.length import Length, Meter
+from ..measurement.length import Length
 
 
 __all__ = [
@@ -64,8 +64,7 @@ class CustomComboBox(QComboBox):
         
 class CustomMoneyComboBox(CustomComboBox):
     
-    MONEY_FULL_FORM = \
-        [Money.FULL_FORM] + [subclass.FULL_FORM for subclass in Money.__subclasses__()]
+    MONEY_FULL_FORM = [money_type.FULL_FORM for money_type in Money.get_types()]
     
     def __init__(self, function: Callable, parent: QWidget | None = None) -> None:
         super().__init__(self.MONEY_FULL_FORM, parent)
@@ -77,9 +76,7 @@ class CustomMoneyComboBox(CustomComboBox):
 
 class CustomLengthComboBox(CustomComboBox):
 
-    LENGTH_FULL_FORM = \
-        [Length.FULL_FORM, Meter.FULL_FORM] + \
-        [subclass.FULL_FORM for subclass in Meter.__subclasses__()]
+    LENGTH_FULL_FORM = [length_type.FULL_FORM for length_type in Length.get_types()]
 
     def __init__(self, function: Callable, parent: QWidget | None = None) -> None:
         super().__init__(self.LENGTH_FULL_FORM, parent)
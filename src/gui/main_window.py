@@ -31,9 +31,9 @@ from .custom_pushbutton import CustomPushButton
 from .. import _format_number, _format_plural_form
 from ..models.price import Price
 from ..models.surface import Surface
-from ..models.knapsack import BoundedKnapsack
 from ..models.buildings import Apartment, Shop
-from ..models.placement import Binpacker
+from ..models.planner import PlacementPlanner
+from ..models.placement import PackingCache
 from ..value_objects.real import Real
 from ..measurement.money import Money
 from ..measurement.length import Length
@@ -58,6 +58,7 @@ class MainWindow(QMainWindow):
     def __init__(self, application: QApplication) -> None:
         super().__init__()
         self.application = application
+        self.packing_cache = PackingCache(PackingCache.FILE_PATH)
         self.__setup_main_window()
         
     def __setup_main_window(self) -> None:
@@ -108,28 +109,9 @@ class MainWindow(QMainWindow):
             surface = Surface(length, width)
             surface.validate_placement_buildings(buildings)
     
-            solution = BoundedKnapsack.solve_dynamic(surface.area, buildings, budget)
-            # for item in solution:
-            #     print(item)
-            # input()
-            print("Максимум найден!")
-            pacher = Binpacker(int(surface.width), int(surface.length))
-            while True:
-                if pacher.fit_blocks(solution):
-                    self._update_figure(pacher)
-                    break
-                
-                if not isinstance(solution[-1], Apartment | Shop):
-                    raise ValueError("\n\tНевозможно расположить даже требуемые объекты!\n")
-                else:
-                    minimum = solution[-1].profit
-                    
-                index = 0
-                for i, building in enumerate(solution):
-                    if isinstance(building, Apartment | Shop) and building.profit <= minimum:
-                        index = i
-                        minimum = building.profit
-                solution = solution[:index] + solution[index + 1:]
+            planner = PlacementPlanner(surface, cache=self.packing_cache)
+            solution, packer = planner.plan(buildings, budget)
+            self._update_figure(packer)
                 
         except Exception as exception:
             message = type(exception).__name__ + ":" + str(exception)
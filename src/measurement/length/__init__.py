@@ -8,6 +8,8 @@ from .length_converter import *
 import operator
 from typing import Type, Union
 
+from ... import _validation_operation
+
 def _meter_operate(
     right: object, 
     right_type: Type | Union[Type],
@@ -28,6 +30,17 @@ def _meter_operate(
         right = MeterConverter.convert(right, Meter)
     return operator(right, left)
 
+def _meter_compare(
+    right: object,
+    left: object,
+    operator: operator,
+    left_type: Type
+) -> bool:
+    result = Meter._fast_operate(right, left, operator)
+    if result is not None:
+        return result
+    return _validation_operation(right, left, operator, left_type)
+
 def _meter_math(
     right: object, 
     right_type: Type | Union[Type],
@@ -35,6 +48,9 @@ def _meter_math(
     left_type: Type | Union[Type],
     operator: operator, 
 ) -> object:
+    value = Meter._fast_operate(right, left, operator)
+    if value is not None:
+        return Meter._from_meters(value)
     left_type._validate(right, left, operator)
     real = left_type._operate(right, left, operator)
     if isinstance(right, right_type) or isinstance(left, right_type):
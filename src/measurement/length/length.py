@@ -1,6 +1,6 @@
 import math
 import operator
-from typing import Tuple
+from typing import Tuple, Type
 
 from .length_meta import LengthMeta
 
@@ -9,6 +9,7 @@ from .. import REAL_TYPES, DEFAULT_FULL_FORM, DEFAULT_SHORT_FORM, DEFAULT_FORMS
 from ... import _format_plural_form
 from ... import _error, _validate, _operate, _type_error, _validation_operation
 from ... import OPERATORS
+from ...validators import NUMBER_TYPES
 from ...value_objects import Real, RealValidator
 
 
@@ -21,6 +22,7 @@ class Length(metaclass=LengthMeta):
     
     __slots__ = [
         "_value",
+        "_meters",
     ]
     
     SIZE_SI = 1
@@ -48,10 +50,54 @@ class Length(metaclass=LengthMeta):
         handler(RealValidator.validate, s, value, 0)
         
         self._value = value
+        self._meters = self._get_meters(value.value)
         
     def __init__(self, value: REAL_TYPES = DEFAULT_LENGTH_VALUE) -> None:
         self.value = value.value if isinstance(value, Length) else value
         
+    @classmethod
+    def _get_meters(cls, value: NUMBER_TYPES) -> NUMBER_TYPES | None:
+        # Значение в метрах для арифметики между единицами без конвертации;
+        # хранится только для int и float, единица нужна лишь для вывода
+        return value * cls.SIZE_SI if type(value) in Real.FAST_TYPES else None
+        
+    @classmethod
+    def _trusted(cls, value: NUMBER_TYPES) -> "Length":
+        length = object.__new__(cls)
+        length._value = Real._trusted(value)
+        length._meters = cls._get_meters(value)
+        return length
+        
+    # ------------------- Registry ---------------------------
+    
+    # Реестр единиц длины в порядке объявления: заполняется один раз через
+    # __init_subclass__, наборы единиц кэшируются по классу
+    _TYPES = dict()
+    _FULL_FORMS = dict()
+    _SUBTYPES = dict()
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        Length._register(cls)
+        
+    @staticmethod
+    def _register(_type: Type) -> None:
+        Length._TYPES[_type] = _type.FULL_FORM
+        Length._FULL_FORMS.setdefault(_type.FULL_FORM, _type)
+        Length._SUBTYPES.clear()
+        
+    @classmethod
+    def get_types(cls) -> Tuple[Type, ...]:
+        types = Length._SUBTYPES.get(cls)
+        if types is None:
+            types = tuple(_type for _type in Length._TYPES if issubclass(_type, cls))
+            Length._SUBTYPES[cls] = types
+        return types
+    
+    @classmethod
+    def find_type(cls, full_form: str) -> Type | None:
+        return Length._FULL_FORMS.get(full_form)
+        
     # ------------------- Output ---------------------------
         
     def __format_value(self) -> str:
@@ -258,4 +304,7 @@ class Length(metaclass=LengthMeta):
         except AttributeError:
             pass
         message = f"Класс '{self.class_name}' не содержит атрибут {name}!"
-        raise AttributeError(_error(self, message))
\ No newline at end of file
+        raise AttributeError(_error(self, message))
+
+
+Length._register(Length)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Type, List
+from typing import Type, Tuple
 
 from .meter import Meter
 from .length import Length
@@ -27,8 +27,8 @@ class LengthConverter(Converter):
 class MeterConverter(LengthConverter):
     
     @classmethod
-    def get_meter_types(cls) -> List[Type]:
-        return [Meter] + [subclass for subclass in Meter.__subclasses__()]
+    def get_meter_types(cls) -> Tuple[Type, ...]:
+        return Meter.get_types()
     
     @classmethod
     def _increase_meter_type(cls, value: Meter) -> Meter:
@@ -41,7 +41,7 @@ class MeterConverter(LengthConverter):
     @classmethod
     def convert(cls, input: Length, output: Type = Length) -> Length:
         s = f"\n\t{cls.__name__}.convert: "
-        meter_types = cls.get_meter_types() + [Length]
+        meter_types = Length.get_types()
         
         handler = Validator._handle_exception
         handler(Validator.validate_object_type, s, input, meter_types)
@@ -61,7 +61,7 @@ class MeterConverter(LengthConverter):
     @classmethod
     def auto_convert(cls, value: Length) -> Length:
         s = f"\n\t{cls.__name__}.auto_convert: "
-        meter_types = cls.get_meter_types() + [Length]
+        meter_types = Length.get_types()
         
         handler = Validator._handle_exception
         handler(Validator.validate_object_type, s, value, meter_types)
@@ -58,8 +58,8 @@ class LengthFactoryMethod(RealFactoryMethod):
         handler(RealValidator._validate_interval, s, minimum, 0)
         handler(RealValidator._validate_interval, s, maximum, 0)
         
-        subclasses = [Meter, Length] + [subclass for subclass in Meter.__subclasses__()]
-        meter_types = [NoneType] + subclasses
+        subclasses = Length.get_types()
+        meter_types = (NoneType, *subclasses)
         handler(Validator.validate_type_of_type, s, length_type, meter_types)
     
         length_type = random.choice(subclasses) if length_type == NoneType else length_type
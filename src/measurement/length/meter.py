@@ -9,6 +9,8 @@ from .. import REAL_TYPES
 from ... import _format_plural_form
 from ... import _validate, _operate, _validation_operation
 from ... import DEFAULT_PLURAL_FORM
+from ...validators import DEFAULT_NUMBER_MAXIMUM
+from ...value_objects import Real
 
 
 __all__ = [
@@ -54,6 +56,23 @@ class Meter(Length):
     def _operate(right: object, left: object, operator: operator) -> object:
         return _operate(right, REAL_TYPES, left, Meter, operator)
     
+    # ------------------- Fast path ---------------------------
+    
+    @staticmethod
+    def _fast_operate(right: object, left: object, operator: operator) -> object:
+        # Обе величины — единицы метра: одна операция над значениями в метрах
+        if isinstance(right, Meter) and isinstance(left, Meter):
+            right_meters, left_meters = right._meters, left._meters
+            if right_meters is not None and left_meters is not None:
+                return operator(right_meters, left_meters)
+        return None
+    
+    @staticmethod
+    def _from_meters(value: object) -> "Meter":
+        if type(value) in Real.FAST_TYPES and 0 <= value <= DEFAULT_NUMBER_MAXIMUM:
+            return Meter._trusted(value)
+        return Meter(value)
+    
     # ------------------- Unary operators ---------------------------
     
     def __floor__(self) -> "Meter":
@@ -72,6 +91,9 @@ class Meter(Length):
     
     @staticmethod
     def _compare(right: object, left: object, operator: operator) -> bool:
+        result = Meter._fast_operate(right, left, operator)
+        if result is not None:
+            return result
         return _validation_operation(right, left, operator, Meter)
     
     def __eq__(self, other: object) -> bool:
@@ -93,6 +115,9 @@ class Meter(Length):
     
     @staticmethod
     def _math(right: object, left: object, operator: operator) -> "Meter":
+        value = Meter._fast_operate(right, left, operator)
+        if value is not None:
+            return Meter._from_meters(value)
         return Meter(_validation_operation(right, left, operator, Meter))
     
     def __add__(self, other: object) -> "Meter":
@@ -2,13 +2,11 @@ import math
 import operator
 from typing import Tuple
 
-from . import _meter_math, _meter_operate
+from . import _meter_math, _meter_operate, _meter_compare
 from .meter import Meter
 
 from .. import REAL_TYPES
 
-from ... import _validation_operation
-
 
 __all__ = [
     "NanoMeter",
@@ -52,7 +50,7 @@ class NanoMeter(Meter):
     
     @staticmethod
     def _compare(right: object, left: object, operator: operator) -> bool:
-        return _validation_operation(right, left, operator, NanoMeter)
+        return _meter_compare(right, left, operator, NanoMeter)
     
     def __eq__(self, other: object) -> bool:
         return NanoMeter._compare(self, other, operator.eq)
@@ -1,6 +1,6 @@
 import math
 import operator
-from typing import Tuple
+from typing import Tuple, Type
 
 from .money_meta import MoneyMeta
 
@@ -52,6 +52,42 @@ class Money(metaclass=MoneyMeta):
     def __init__(self, value: REAL_TYPES = DEFAULT_MONEY_VALUE) -> None:
         self.value = value.value if isinstance(value, Money) else value
         
+    # ------------------- Registry ---------------------------
+    
+    # Реестр валют: заполняется при объявлении через __init_subclass__,
+    # поиск по полному и международному названию без перебора подклассов
+    _TYPES = dict()
+    _FULL_FORMS = dict()
+    _INTERNATIONAL_FORMS = dict()
+    _SUBTYPES = dict()
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        Money._register(cls)
+        
+    @staticmethod
+    def _register(_type: Type) -> None:
+        Money._TYPES[_type] = _type.FULL_FORM
+        Money._FULL_FORMS.setdefault(_type.FULL_FORM, _type)
+        Money._INTERNATIONAL_FORMS.setdefault(_type.INTERNATIONAL_FORM, _type)
+        Money._SUBTYPES.clear()
+        
+    @classmethod
+    def get_types(cls) -> Tuple[Type, ...]:
+        types = Money._SUBTYPES.get(cls)
+        if types is None:
+            types = tuple(_type for _type in Money._TYPES if issubclass(_type, cls))
+            Money._SUBTYPES[cls] = types
+        return types
+    
+    @classmethod
+    def find_type(cls, full_form: str) -> Type | None:
+        return Money._FULL_FORMS.get(full_form)
+    
+    @classmethod
+    def find_international_type(cls, international_form: str) -> Type | None:
+        return Money._INTERNATIONAL_FORMS.get(international_form)
+        
     # ------------------- Output ---------------------------
         
     def __format_value(self) -> str:
@@ -262,4 +298,7 @@ class Money(metaclass=MoneyMeta):
         except AttributeError:
             pass
         message = f"Класс '{self.class_name}' не содержит атрибут {name}!"
-        raise AttributeError(_error(self, message))
\ No newline at end of file
+        raise AttributeError(_error(self, message))
+
+
+Money._register(Money)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import os
 import pandas
-from typing import Dict, Type, List
+from typing import Dict, Type, Tuple
 from datetime import date
 
 from .money import Money
@@ -24,8 +24,8 @@ class MoneyConverter(Converter):
     FILE_PATH = os.path.join(CURRENT_DIR, "currency.xml")
     
     @classmethod
-    def get_money_types(cls) -> List[Type]:
-        return [subclass for subclass in Money.__subclasses__()]
+    def get_money_types(cls) -> Tuple[Type, ...]:
+        return Money.get_types()[1:]
     
     @classmethod
     def _get_currency(cls) -> pandas.DataFrame:
@@ -42,7 +42,7 @@ class MoneyConverter(Converter):
     
     @classmethod
     def _get_daily_currency_values(cls) -> Dict[str, float]:
-        money_types = [subclass for subclass in Money.__subclasses__()]
+        money_types = cls.get_money_types()
         international_forms = [money_type.INTERNATIONAL_FORM for money_type in money_types]
         
         df = None
@@ -77,7 +77,7 @@ class MoneyConverter(Converter):
     @classmethod
     def convert(cls, input: Money, output: Type = Money) -> Money:
         s = f"\n\t{cls.__name__}.convert: "
-        money_types = cls.get_money_types() + [Money]
+        money_types = Money.get_types()
         
         handler = Validator._handle_exception
         handler(Validator.validate_object_type, s, input, money_types)
@@ -105,7 +105,7 @@ class MoneyConverter(Converter):
     @classmethod
     def auto_convert(cls, value: Money) -> Money:
         s = f"\n\t{cls.__name__}.auto_convert: "
-        money_types = cls.get_money_types() + [Money]
+        money_types = Money.get_types()
         
         handler = Validator._handle_exception
         handler(Validator.validate_object_type, s, value, money_types)
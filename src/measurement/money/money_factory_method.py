@@ -50,8 +50,8 @@ class MoneyFactoryMethod(RealFactoryMethod):
         handler(RealValidator.validate, s, minimum, 0)
         handler(RealValidator.validate, s, maximum, 0)
         
-        subclasses = [Money] + [subclass for subclass in Money.__subclasses__()]
-        money_types = [NoneType] + subclasses
+        subclasses = Money.get_types()
+        money_types = (NoneType, *subclasses)
         handler(Validator.validate_type_of_type, s, money_type, money_types)
         
         money_type = random.choice(subclasses) if money_type == NoneType else money_type
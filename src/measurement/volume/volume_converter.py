@@ -25,7 +25,7 @@ class VolumeConverter(MeterConverter):
     @classmethod
     def convert(cls, input: Length, output: Type = Length) -> str:
         s = f"\n\t{cls.__name__}.convert: "
-        meter_types = [Length] + cls.get_meter_types()
+        meter_types = Length.get_types()
         
         handler = Validator._handle_exception
         handler(Validator.validate_object_type, s, input, meter_types)
@@ -36,7 +36,7 @@ class VolumeConverter(MeterConverter):
     @classmethod
     def auto_convert(cls, value: Length) -> str:
         s = f"\n\t{cls.__name__}.auto_convert: "
-        meter_types = [Length] + cls.get_meter_types()
+        meter_types = Length.get_types()
         
         handler = Validator._handle_exception
         handler(Validator.validate_object_type, s, value, meter_types)
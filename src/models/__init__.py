@@ -3,4 +3,5 @@ from .price import *
 from .buildings import *
 from .surface import *
 from .knapsack import *
-from .placement import *
\ No newline at end of file
+from .placement import *
+from .planner import *
\ No newline at end of file
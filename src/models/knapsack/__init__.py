@@ -1 +1,4 @@
+from .knapsack_solution import *
+from .branch_and_bound_knapsack import *
+from .incremental_knapsack import *
 from .bounded_knapsack import *
\ No newline at end of file
@@ -1,14 +1,24 @@
 import copy
-from typing import List, Tuple
+import math
+import heapq
+import numpy as np
+from array import array
+from collections import deque
+from operator import itemgetter
+from typing import Callable, List, Tuple
 
-# import heapq
+from .knapsack_solution import KnapsackSolution
+from .incremental_knapsack import IncrementalKnapsack
+from .branch_and_bound_knapsack import BranchAndBoundKnapsack
 
 from ..price import Price
 from ..buildings import Building, Apartment, Shop
 
 # from ...geometry.one_dimensional import Line
 from ...measurement.length import Length, LengthValidator, Meter
+from ...measurement.money import Money, MoneyValidator
 # from ...measurement.square import SquareConverter
+from ...validators import Validator, IntValidator
 
 
 __all__ = [
@@ -18,12 +28,40 @@ __all__ = [
 
 class BoundedKnapsack:
     
+    CAPACITY_QUANTUM = 100
+    AUTO_RESOLUTION = "auto"
+    COST_RESOLUTION = 1_000
+    
+    DEFAULT_SOLUTIONS_AMOUNT = 3
+    TOP_K_BATCH = 16
+    
+    MAXIMUM_TABLE_SIZE = 5_000_000
+    BRANCH_AND_BOUND_MAXIMUM_ITEMS = 10
+    
+    PYTHON_ENGINE = "python"
+    NUMPY_ENGINE = "numpy"
+    ENGINES = [
+        PYTHON_ENGINE,
+        NUMPY_ENGINE,
+    ]
+    
+    BOUNDED_STRATEGY = "bounded"
+    BINARY_STRATEGY = "binary"
+    MONOTONE_STRATEGY = "monotone"
+    LEAN_STRATEGY = "lean"
+    STRATEGIES = [
+        BOUNDED_STRATEGY,
+        BINARY_STRATEGY,
+        MONOTONE_STRATEGY,
+        LEAN_STRATEGY,
+    ]
+    
     @classmethod
     def __prepare(
         cls, 
         buildings: List[Building],
         budget: Price
-    ) -> Tuple[Length, List[Building], List[Building]]:
+    ) -> Tuple[Length, List[Building], List[int], List[Building], Price]:
         area = 0
         new_buildings = list()
         required_buildings = list()
@@ -42,155 +80,730 @@ class BoundedKnapsack:
                 amount = 1
             amounts.append(amount)
     
-        return area, new_buildings, amounts, required_buildings
+        return area, new_buildings, amounts, required_buildings, budget
     
     @classmethod
-    def _convert_to_binary_knapsack(cls, buildings, amounts):
+    def __clamp_amounts(
+        cls,
+        capacity: Length,
+        area: Length,
+        buildings: List[Building],
+        amounts: List[int]
+    ) -> None:
+        for i, (building, amount) in enumerate(zip(buildings, amounts)):
+            building_area = building.area_with_indent * amount
+            if building_area > capacity - area:
+                amounts[i] = int((capacity - area) // building.area_with_indent)
+    
+    @classmethod
+    def __assemble(
+        cls,
+        required_buildings: List[Building],
+        buildings: List[Building],
+        counts: List[int]
+    ) -> List[Building]:
+        solution = list(required_buildings)
+        for i in range(len(buildings), 0, -1):
+            solution.extend([buildings[i - 1]] * counts[i - 1])
+        return solution
+    
+    @classmethod
+    def _convert_to_binary_knapsack(cls, amounts: List[int]) -> List[Tuple[int, int]]:
         result = list()
         count = copy.deepcopy(amounts)
-        for i, building in enumerate(buildings):
+        for i in range(len(count)):
             j = 1
             while count[i] >= j:
-                result.append((j * building.area_with_indent, j * building.profit))
+                result.append((i, j))
                 count[i] -= j
                 j *= 2
             if count[i] > 0:
-                result.append((count[i] * building.area_with_indent, count[i] * building.profit))
-        return result, count
+                result.append((i, count[i]))
+        return result
     
     @classmethod
-    def solve_dynamic(
+    def _validate_choice(cls, value: str, choices: List[str], s: str) -> None:
+        handler = Validator._handle_exception
+        handler(Validator.validate_object_type, s, value, str)
+        
+        if value not in choices:
+            message = s + f"Недопустимое значение '{value}'! "
+            message += f"Ожидалось одно из: {', '.join(choices)}!"
+            raise ValueError(message)
+    
+    @classmethod
+    def _validate_resolution(cls, resolution: int | str, s: str) -> None:
+        handler = Validator._handle_exception
+        handler(Validator.validate_object_type, s, resolution, int | str)
+        
+        if isinstance(resolution, str):
+            cls._validate_choice(resolution, [cls.AUTO_RESOLUTION], s)
+        else:
+            handler(IntValidator.validate, s, resolution, 1)
+    
+    @classmethod
+    def _get_footprints(cls, buildings: List[Building]) -> List[float]:
+        return [round(float(building.area_with_indent), 6) for building in buildings]
+    
+    @classmethod
+    def _get_profits(cls, buildings: List[Building]) -> List[float]:
+        return [float(building.profit) for building in buildings]
+    
+    @classmethod
+    def _get_quantum(cls, footprints: List[float], resolution: int | str) -> int:
+        if resolution != cls.AUTO_RESOLUTION:
+            return resolution
+        return math.gcd(*(math.ceil(footprint) for footprint in footprints)) or 1
+    
+    @classmethod
+    def _get_weights(cls, footprints: List[float], quantum: int) -> List[int]:
+        return [math.ceil(footprint / quantum) for footprint in footprints]
+    
+    # ------------------- Engines ---------------------------
+    
+    @classmethod
+    def _fill_python_table(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int
+    ) -> List[List[float]]:
+        table = [[0.0 for _ in range(W + 1)] for _ in range(len(weights) + 1)]
+        for i, (weight, profit) in enumerate(zip(weights, profits)):
+            previous, current = table[i], table[i + 1]
+            for c in range(W + 1):
+                best = previous[c]
+                for k in range(1, amounts[i] + 1):
+                    if c < k * weight:
+                        break
+                    best = max(best, previous[c - k * weight] + k * profit)
+                current[c] = best
+        return table
+    
+    @classmethod
+    def _fill_numpy_table(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int
+    ) -> np.ndarray:
+        table = np.zeros((len(weights) + 1, W + 1), dtype=np.float64)
+        for i, (weight, profit) in enumerate(zip(weights, profits)):
+            previous, current = table[i], table[i + 1]
+            current[:] = previous
+            for k in range(1, amounts[i] + 1):
+                shift = k * weight
+                if shift > W:
+                    break
+                np.maximum(
+                    current[shift:], 
+                    previous[:W + 1 - shift] + k * profit, 
+                    out=current[shift:]
+                )
+        return table
+    
+    @classmethod
+    def _fill_python_monotone_table(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int
+    ) -> List[List[float]]:
+        table = [[0.0 for _ in range(W + 1)] for _ in range(len(weights) + 1)]
+        for i, (weight, profit) in enumerate(zip(weights, profits)):
+            previous, current = table[i], table[i + 1]
+            if weight == 0:
+                table[i + 1] = [max(value, value + amounts[i] * profit) for value in previous]
+                continue
+            # Окно из amounts[i] + 1 позиций по каждому остатку от деления на вес
+            for r in range(min(weight, W + 1)):
+                window = deque()
+                for q, c in enumerate(range(r, W + 1, weight)):
+                    key = previous[c] - q * profit
+                    while window and window[-1][1] <= key:
+                        window.pop()
+                    window.append((q, key))
+                    if window[0][0] < q - amounts[i]:
+                        window.popleft()
+                    j = window[0][0]
+                    current[c] = previous[r + j * weight] + (q - j) * profit
+        return table
+    
+    @classmethod
+    def _sliding_maximum(cls, values: np.ndarray, size: int) -> np.ndarray:
+        m = values.shape[0]
+        if size >= m:
+            return np.maximum.accumulate(values, axis=0)
+        
+        blocks = -(-m // size)
+        padded = np.full((blocks * size,) + values.shape[1:], -np.inf)
+        padded[:m] = values
+        shaped = padded.reshape((blocks, size) + values.shape[1:])
+        prefix = np.maximum.accumulate(shaped, axis=1).reshape(padded.shape)[:m]
+        suffix = np.flip(np.maximum.accumulate(np.flip(shaped, axis=1), axis=1), axis=1)
+        suffix = suffix.reshape(padded.shape)[:m]
+        
+        result = prefix.copy()
+        result[size - 1:] = np.maximum(suffix[:m - size + 1], prefix[size - 1:])
+        return result
+    
+    @classmethod
+    def _fill_numpy_monotone_table(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int
+    ) -> np.ndarray:
+        table = np.zeros((len(weights) + 1, W + 1), dtype=np.float64)
+        for i, (weight, profit) in enumerate(zip(weights, profits)):
+            table[i + 1] = cls._fill_numpy_monotone_row(table[i], weight, profit, amounts[i], W)
+        return table
+    
+    @classmethod
+    def _fill_numpy_monotone_row(
+        cls,
+        previous: np.ndarray,
+        weight: int,
+        profit: float,
+        amount: int,
+        W: int
+    ) -> np.ndarray:
+        if weight == 0:
+            return np.maximum(previous, previous + amount * profit)
+        rows = -(-(W + 1) // weight)
+        padded = np.full(rows * weight, -np.inf)
+        padded[:W + 1] = previous
+        steps = np.arange(rows)[:, None] * profit
+        best = cls._sliding_maximum(padded.reshape(rows, weight) - steps, amount + 1)
+        return (best + steps).reshape(-1)[:W + 1]
+    
+    @classmethod
+    def _get_fill(cls, strategy: str, engine: str) -> Callable:
+        if strategy == cls.MONOTONE_STRATEGY:
+            return cls._fill_numpy_monotone_table \
+                if engine == cls.NUMPY_ENGINE else \
+                    cls._fill_python_monotone_table
+        return cls._fill_numpy_table \
+            if engine == cls.NUMPY_ENGINE else \
+                cls._fill_python_table
+    
+    @classmethod
+    def _traceback(
+        cls,
+        table: List[List[float]] | np.ndarray,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int
+    ) -> List[int]:
+        counts = [0] * len(weights)
+        for i in range(len(weights), 0, -1):
+            weight, profit = weights[i - 1], profits[i - 1]
+            best = None
+            for k in range(amounts[i - 1], -1, -1):
+                if k * weight > W:
+                    continue
+                value = table[i - 1][W - k * weight] + k * profit
+                if best is None or value > best:
+                    best, counts[i - 1] = value, k
+            W -= counts[i - 1] * weight
+        return counts
+    
+    @classmethod
+    def _solve_bounded(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        engine: str = PYTHON_ENGINE,
+        strategy: str = BOUNDED_STRATEGY
+    ) -> List[int]:
+        table = cls._get_fill(strategy, engine)(weights, profits, amounts, W)
+        return cls._traceback(table, weights, profits, amounts, W)
+    
+    @classmethod
+    def _solve_binary(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        engine: str = PYTHON_ENGINE
+    ) -> List[int]:
+        pieces = cls._convert_to_binary_knapsack(amounts)
+        piece_weights = [copies * weights[i] for i, copies in pieces]
+        piece_profits = [copies * profits[i] for i, copies in pieces]
+        chosen = cls._solve_bounded(piece_weights, piece_profits, [1] * len(pieces), W, engine)
+        
+        counts = [0] * len(weights)
+        for (i, copies), taken in zip(pieces, chosen):
+            counts[i] += copies * taken
+        return counts
+    
+    # ------------------- Memory-lean knapsack ---------------------------
+    
+    @classmethod
+    def _fill_python_lean_row(
         cls, 
-        capacity: Length, 
+        row: array, 
+        weight: int, 
+        profit: float, 
+        W: int
+    ) -> bytearray:
+        bits = bytearray((W >> 3) + 1)
+        for c in range(W, weight - 1, -1):
+            candidate = row[c - weight] + profit
+            if candidate > row[c]:
+                row[c] = candidate
+                bits[c >> 3] |= 1 << (c & 7)
+        return bits
+    
+    @classmethod
+    def _fill_numpy_lean_row(
+        cls, 
+        row: np.ndarray, 
+        weight: int, 
+        profit: float, 
+        W: int
+    ) -> np.ndarray:
+        improved = np.zeros(W + 1, dtype=bool)
+        if weight <= W:
+            candidate = row[:W + 1 - weight] + profit
+            improved[weight:] = candidate > row[weight:]
+            np.maximum(row[weight:], candidate, out=row[weight:])
+        return np.packbits(improved, bitorder="little")
+    
+    @classmethod
+    def _solve_lean(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        engine: str = PYTHON_ENGINE
+    ) -> List[int]:
+        if engine == cls.NUMPY_ENGINE:
+            row, fill = np.zeros(W + 1, dtype=np.float64), cls._fill_numpy_lean_row
+        else:
+            row, fill = array("d", bytes(8 * (W + 1))), cls._fill_python_lean_row
+        
+        pieces = cls._convert_to_binary_knapsack(amounts)
+        choices = [fill(row, copies * weights[i], copies * profits[i], W) for i, copies in pieces]
+        
+        counts = [0] * len(weights)
+        for (i, copies), bits in zip(reversed(pieces), reversed(choices)):
+            if bits[W >> 3] >> (W & 7) & 1:
+                counts[i] += copies
+                W -= copies * weights[i]
+        return counts
+    
+    @classmethod
+    def _solve_counts(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        engine: str = PYTHON_ENGINE,
+        strategy: str = BINARY_STRATEGY
+    ) -> List[int]:
+        if strategy == cls.BINARY_STRATEGY:
+            return cls._solve_binary(weights, profits, amounts, W, engine)
+        if strategy == cls.LEAN_STRATEGY:
+            return cls._solve_lean(weights, profits, amounts, W, engine)
+        return cls._solve_bounded(weights, profits, amounts, W, engine, strategy)
+    
+    # ------------------- Incremental knapsack ---------------------------
+    
+    @classmethod
+    def _get_keys(cls, buildings: List[Building]) -> List[Tuple[int, int]]:
+        seen = dict()
+        keys = list()
+        for building in buildings:
+            occurrence = seen.get(id(building), 0)
+            seen[id(building)] = occurrence + 1
+            keys.append((id(building), occurrence))
+        return keys
+    
+    @classmethod
+    def _solve_incremental_counts(
+        cls,
+        state: IncrementalKnapsack,
+        keys: List[Tuple[int, int]],
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        quantum: int
+    ) -> List[int]:
+        signatures = list(zip(weights, profits, amounts))
+        order, prefix = state.update(keys, signatures, W, quantum)
+        
+        index = {key: i for i, key in enumerate(keys)}
+        positions = [index[key] for key in order]
+        ordered_weights = [weights[i] for i in positions]
+        ordered_profits = [profits[i] for i in positions]
+        ordered_amounts = [amounts[i] for i in positions]
+        
+        rows = state.get_rows()
+        for i in range(prefix, len(order)):
+            state.append_row(cls._fill_numpy_monotone_row(
+                rows[i], 
+                ordered_weights[i], 
+                ordered_profits[i], 
+                ordered_amounts[i], 
+                state.capacity
+            ))
+        
+        ordered_counts = cls._traceback(rows, ordered_weights, ordered_profits, ordered_amounts, W)
+        counts = [0] * len(weights)
+        for i, count in zip(positions, ordered_counts):
+            counts[i] = count
+        return counts
+    
+    @classmethod
+    def solve_incremental(
+        cls,
+        capacity: Length,
         buildings: List[Building],
-        budget: Price
-    ) -> List[Building]:
-        area, new_buildings, amounts, required_buildings = cls.__prepare(buildings, budget)
+        budget: Price,
+        state: IncrementalKnapsack,
+        resolution: int = CAPACITY_QUANTUM
+    ) -> KnapsackSolution:
+        s = f"\n\t{cls.__name__}.solve_incremental: "
+        handler = Validator._handle_exception
+        handler(Validator.validate_object_type, s, state, IncrementalKnapsack)
+        handler(IntValidator.validate, s, resolution, 1)
         
-        sum_area = sum(building.area_with_indent for building in required_buildings)
-        sum_area += sum(building.area_with_indent * amounts[i] for i, building in enumerate(new_buildings))
-        if sum_area < capacity:
-            return required_buildings + [building \
-                for building, amount in zip(new_buildings, amounts) \
-                    for _ in range(amount)]
+        area, new_buildings, amounts, required_buildings, _ = cls.__prepare(buildings, budget)
+        cls.__clamp_amounts(capacity, area, new_buildings, amounts)
         
-        # print(amounts)
+        footprints = cls._get_footprints(new_buildings)
+        W = int(round(capacity - area)) // resolution
+        weights = cls._get_weights(footprints, resolution)
+        profits = cls._get_profits(new_buildings)
+        keys = cls._get_keys(new_buildings)
+        counts = cls._solve_incremental_counts(state, keys, weights, profits, amounts, W, resolution)
         
-        for i, (building, amount) in enumerate(zip(new_buildings, amounts)):
-            building_area = building.area_with_indent * amount
-            if building_area > capacity - area:
-                amounts[i] = int((capacity - area) // building.area_with_indent)
+        solution = cls.__assemble(required_buildings, new_buildings, counts)
+        return KnapsackSolution(solution, resolution, (len(new_buildings) + 1, state.capacity + 1))
     
-        # print(amounts)
+    # ------------------- Two-dimensional knapsack ---------------------------
+    
+    @classmethod
+    def _solve_two_dimensional_counts(
+        cls,
+        weights: List[int],
+        costs: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        B: int
+    ) -> List[int]:
+        pieces = cls._convert_to_binary_knapsack(amounts)
+        best = np.zeros((W + 1, B + 1), dtype=np.float64)
+        choices = list()
+        for i, copies in pieces:
+            weight, cost = copies * weights[i], copies * costs[i]
+            chosen = np.zeros((W + 1, B + 1), dtype=bool)
+            if weight <= W and cost <= B:
+                candidate = best[:W + 1 - weight, :B + 1 - cost] + copies * profits[i]
+                improved = candidate > best[weight:, cost:]
+                chosen[weight:, cost:] = improved
+                best[weight:, cost:] = np.where(improved, candidate, best[weight:, cost:])
+            choices.append(np.packbits(chosen))
         
-        # result, new_amounts = BoundedKnapsack._convert_to_binary_knapsack(new_buildings, amounts)
-        # print(result)
-        # print(new_amounts)
-        # # input()
+        stride = B + 1
+        counts = [0] * len(weights)
+        for (i, copies), packed in zip(reversed(pieces), reversed(choices)):
+            index = W * stride + B
+            if packed[index >> 3] >> (7 - (index & 7)) & 1:
+                counts[i] += copies
+                W -= copies * weights[i]
+                B -= copies * costs[i]
+        return counts
+    
+    @classmethod
+    def solve_two_dimensional(
+        cls,
+        capacity: Length,
+        buildings: List[Building],
+        budget: Price,
+        cost_quantum: Money | None = None,
+        resolution: int | str = CAPACITY_QUANTUM
+    ) -> KnapsackSolution:
+        s = f"\n\t{cls.__name__}.solve_two_dimensional: "
+        cls._validate_resolution(resolution, s)
+        if cost_quantum is not None:
+            handler = MoneyValidator._handle_exception
+            handler(MoneyValidator.validate, s, cost_quantum, 1)
         
-        # n = len(result)
-        # W = int(round(capacity - area)) // 100
-        # table = [[0.0 for _ in range(W + 1)] for _ in range(n + 1)]
-        # print(n, W, capacity, area)
-        # print(table)
-        # # input()
+        area, new_buildings, amounts, required_buildings, budget = cls.__prepare(buildings, budget)
+        cls.__clamp_amounts(capacity, area, new_buildings, amounts)
         
-        # for i in range(1, n + 1):
-        #     area_with_indent, profit = result[i - 1]
-        #     for c in range(1, W + 1):
-        #         table[i][c] = table[i - 1][c]
-        #         if c >= int(area_with_indent // 100):
-        #             table[i][c] = max(
-        #                 table[i][c], 
-        #                 table[i - 1][c - int(area_with_indent // 100)] + profit
-        #             )
-                    
-        # print(table)
-        # # input()
+        remaining = float(budget)
+        quantum = float(Price(cost_quantum)) \
+            if cost_quantum is not None else \
+                max(remaining / cls.COST_RESOLUTION, 1.0)
         
-        # solution = required_buildings
-        # remaining_capacity = W
-        
-        # for i in range(min(n, len(amounts)), 0, -1):
-        #     area_with_indent, profit = result[i - 1]
-        #     if remaining_capacity >= int(area_with_indent // 100) and \
-        #         table[i][remaining_capacity] == table[i - 1][remaining_capacity - int(area_with_indent // 100)] + profit:
-        #         print(i - 1)
-        #         print(amounts)
-        #         print(amounts[i - 1])
-        #         solution.append(new_buildings[(i - 1) // amounts[i - 1]])  # Определяем оригинальное здание
-        #         remaining_capacity -= int(area_with_indent // 100)
-        
-        # i = n
-        # while i > 0 and remaining_capacity > 0:
-        #     print(table[i][remaining_capacity])
-        #     print(table[i - 1][remaining_capacity])
-        #     if table[i][remaining_capacity] != table[i - 1][remaining_capacity]:
-        #         area_with_indent, profit = result[i - 1]
-        #         print(area_with_indent, profit)
-        #         # Определяем оригинальное здание
-        #         original_building_index = (i - 1) // len(amounts)
-        #         print(i - 1, len(amounts), original_building_index)
-        #         print(len(new_buildings))
-        #         original_building = new_buildings[original_building_index - 1]
-        #         solution.append(original_building)
-        #         remaining_capacity -= int(area_with_indent // 100)
-        #     i -= 1
-        
-        # return solution
+        footprints = cls._get_footprints(new_buildings)
+        area_quantum = cls._get_quantum(footprints, resolution)
+        W = int(round(capacity - area)) // area_quantum
+        B = int(remaining // quantum)
+        weights = cls._get_weights(footprints, area_quantum)
+        profits = cls._get_profits(new_buildings)
+        costs = [math.ceil(float(building.price_to_build) / quantum) for building in new_buildings]
+        counts = cls._solve_two_dimensional_counts(weights, costs, profits, amounts, W, B)
+        
+        solution = cls.__assemble(required_buildings, new_buildings, counts)
+        return KnapsackSolution(solution, area_quantum, (W + 1, B + 1))
     
+    # ------------------- K best solutions ---------------------------
     
-        # W = int(round(capacity - area)) // 100
-        # table = [[[] for _ in range(W + 1)] for _ in range(len(new_buildings) + 1)]
-        # table[0][0] = [(0, [])]
+    @classmethod
+    def _solve_top_k_python_counts(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        K: int
+    ) -> List[Tuple[float, List[int]]]:
+        # Ячейка c хранит до K лучших наборов с суммарным весом ровно c:
+        # (прибыль, предыдущая ячейка, ранг в ней, количество копий)
+        rows = [[[(0.0, -1, -1, 0)]] + [list() for _ in range(W)]]
+        for i, (weight, profit) in enumerate(zip(weights, profits)):
+            previous = rows[-1]
+            current = [list() for _ in range(W + 1)]
+            for c in range(W + 1):
+                candidates = list()
+                for k in range(amounts[i] + 1):
+                    if c < k * weight:
+                        break
+                    for rank, entry in enumerate(previous[c - k * weight]):
+                        candidates.append((entry[0] + k * profit, c - k * weight, rank, k))
+                current[c] = heapq.nlargest(K, candidates, key=itemgetter(0))
+            rows.append(current)
         
-        # for i, building in enumerate(new_buildings):
-        #     for c in range(W + 1):
-        #         if table[i][c]:
-        #             for k in range(1, amounts[i] + 1):
-        #                 new_weight = c + int(k * building.area_with_indent // 100)
-        #                 if new_weight <= W:
-        #                     for profit, solution in table[i][c]:
-        #                         new_profit = profit + k * building.profit
-        #                         new_solution = solution + [building] * k
-        #                         heapq.heappush(table[i + 1][new_weight], (new_profit, new_solution))
-        #                         if len(table[i + 1][new_weight]) > 3:
-        #                             heapq.heappop(table[i + 1][new_weight])
-        
-        # final_solutions = []
-        # for profit, solution in table[len(new_buildings)][W]:
-        #     final_solution = required_buildings + solution
-        #     final_solutions.append(final_solution)
-        
-        # # Добавляем недостающие решения, если они меньше трех
-        # if len(final_solutions) < 3:
-        #     final_solutions.extend([required_buildings] * (3 - len(final_solutions)))
-        
-        # return final_solutions
+        best = heapq.nlargest(K, (
+            (entry[0], c, rank) \
+                for c, cell in enumerate(rows[-1]) \
+                    for rank, entry in enumerate(cell)
+        ), key=itemgetter(0))
+        
+        result = list()
+        for profit, c, rank in best:
+            counts = [0] * len(weights)
+            for i in range(len(weights), 0, -1):
+                _, c, rank, counts[i - 1] = rows[i][c][rank]
+            result.append((profit, counts))
+        return result
+    
+    @classmethod
+    def _solve_top_k_numpy_counts(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        K: int
+    ) -> List[Tuple[float, List[int]]]:
+        # Та же таблица слоями (K, W + 1): копии очередного здания
+        # добавляются пачками по TOP_K_BATCH, и из текущих K лучших и
+        # сдвинутых слоёв пачки K раз выбирается максимум; источник
+        # хранится как k * K + ранг в предыдущем слое
+        columns = np.arange(W + 1)
+        ranks = np.broadcast_to(np.arange(K)[:, None], (K, W + 1))
+        values = np.full((K, W + 1), -np.inf)
+        values[0, 0] = 0.0
+        sources = list()
+        for weight, profit, amount in zip(weights, profits, amounts):
+            best, source = values, ranks
+            copies = min(amount, W // weight)
+            for first in range(1, copies + 1, cls.TOP_K_BATCH):
+                batch = range(first, min(first + cls.TOP_K_BATCH, copies + 1))
+                candidates = np.full(((len(batch) + 1) * K, W + 1), -np.inf)
+                candidates[:K] = best
+                for j, k in enumerate(batch, 1):
+                    candidates[j * K:(j + 1) * K, k * weight:] = values[:, :W + 1 - k * weight] + k * profit
+                origins = np.concatenate([source] + [k * K + ranks for k in batch])
+                best = np.empty((K, W + 1))
+                source = np.empty((K, W + 1), dtype=origins.dtype)
+                for rank in range(K):
+                    order = candidates.argmax(axis=0)
+                    best[rank] = candidates[order, columns]
+                    source[rank] = origins[order, columns]
+                    candidates[order, columns] = -np.inf
+            values = best
+            sources.append(source)
+        
+        flat = values.reshape(-1)
+        order = np.argsort(-flat, kind="stable")[:K]
+        result = list()
+        for index in order:
+            if flat[index] == -np.inf:
+                break
+            rank, c = divmod(int(index), W + 1)
+            counts = [0] * len(weights)
+            for i in range(len(weights), 0, -1):
+                counts[i - 1], rank = divmod(int(sources[i - 1][rank, c]), K)
+                c -= counts[i - 1] * weights[i - 1]
+            result.append((float(flat[index]), counts))
+        return result
+    
+    @classmethod
+    def _solve_top_k_counts(
+        cls,
+        weights: List[int],
+        profits: List[float],
+        amounts: List[int],
+        W: int,
+        K: int,
+        engine: str = PYTHON_ENGINE
+    ) -> List[Tuple[float, List[int]]]:
+        if engine == cls.NUMPY_ENGINE:
+            return cls._solve_top_k_numpy_counts(weights, profits, amounts, W, K)
+        return cls._solve_top_k_python_counts(weights, profits, amounts, W, K)
+    
+    @classmethod
+    def solve_top_k(
+        cls,
+        capacity: Length,
+        buildings: List[Building],
+        budget: Price,
+        K: int = DEFAULT_SOLUTIONS_AMOUNT,
+        resolution: int | str = CAPACITY_QUANTUM,
+        engine: str = PYTHON_ENGINE
+    ) -> List[KnapsackSolution]:
+        s = f"\n\t{cls.__name__}.solve_top_k: "
+        handler = IntValidator._handle_exception
+        handler(IntValidator.validate, s, K, 1)
+        cls._validate_resolution(resolution, s)
+        cls._validate_choice(engine, cls.ENGINES, s)
+        
+        area, new_buildings, amounts, required_buildings, _ = cls.__prepare(buildings, budget)
+        cls.__clamp_amounts(capacity, area, new_buildings, amounts)
+        
+        footprints = cls._get_footprints(new_buildings)
+        quantum = cls._get_quantum(footprints, resolution)
+        W = int(round(capacity - area)) // quantum
+        weights = cls._get_weights(footprints, quantum)
+        profits = cls._get_profits(new_buildings)
+        
+        return [
+            KnapsackSolution(
+                cls.__assemble(required_buildings, new_buildings, counts), 
+                quantum, 
+                (len(new_buildings) + 1, W + 1, K)
+            ) for _, counts in cls._solve_top_k_counts(weights, profits, amounts, W, K, engine)
+        ]
+    
+    # ------------------- Branch and bound ---------------------------
+    
+    @classmethod
+    def solve_branch_and_bound(
+        cls,
+        capacity: Length,
+        buildings: List[Building],
+        budget: Price
+    ) -> KnapsackSolution:
+        area, new_buildings, amounts, required_buildings, _ = cls.__prepare(buildings, budget)
+        cls.__clamp_amounts(capacity, area, new_buildings, amounts)
         
+        footprints = cls._get_footprints(new_buildings)
+        profits = cls._get_profits(new_buildings)
+        free_area = float(capacity - area)
+        counts = BranchAndBoundKnapsack._solve_counts(footprints, profits, amounts, free_area)
+        
+        solution = cls.__assemble(required_buildings, new_buildings, counts)
+        return KnapsackSolution(solution)
+    
+    @classmethod
+    def _estimate_table_size(
+        cls,
+        capacity: Length,
+        buildings: List[Building],
+        budget: Price,
+        resolution: int | str = CAPACITY_QUANTUM
+    ) -> Tuple[int, int]:
+        area, new_buildings, amounts, _, _ = cls.__prepare(buildings, budget)
+        cls.__clamp_amounts(capacity, area, new_buildings, amounts)
+        
+        quantum = cls._get_quantum(cls._get_footprints(new_buildings), resolution)
+        W = int(round(capacity - area)) // quantum
+        rows = len(cls._convert_to_binary_knapsack(amounts)) + 1
+        return len(new_buildings), rows * (W + 1)
+    
+    @classmethod
+    def solve(
+        cls,
+        capacity: Length,
+        buildings: List[Building],
+        budget: Price,
+        resolution: int | str = CAPACITY_QUANTUM
+    ) -> KnapsackSolution:
+        s = f"\n\t{cls.__name__}.solve: "
+        cls._validate_resolution(resolution, s)
+        
+        items, size = cls._estimate_table_size(capacity, buildings, budget, resolution)
+        if size > cls.MAXIMUM_TABLE_SIZE and items <= cls.BRANCH_AND_BOUND_MAXIMUM_ITEMS:
+            return cls.solve_branch_and_bound(capacity, buildings, budget)
+        return cls.solve_dynamic(
+            capacity, 
+            buildings, 
+            budget, 
+            cls.NUMPY_ENGINE, 
+            cls.BINARY_STRATEGY, 
+            resolution
+        )
+    
+    @classmethod
+    def solve_dynamic(
+        cls, 
+        capacity: Length, 
+        buildings: List[Building],
+        budget: Price,
+        engine: str = PYTHON_ENGINE,
+        strategy: str = BINARY_STRATEGY,
+        resolution: int | str = CAPACITY_QUANTUM
+    ) -> KnapsackSolution:
+        s = f"\n\t{cls.__name__}.solve_dynamic: "
+        cls._validate_choice(engine, cls.ENGINES, s)
+        cls._validate_choice(strategy, cls.STRATEGIES, s)
+        cls._validate_resolution(resolution, s)
+        
+        area, new_buildings, amounts, required_buildings, _ = cls.__prepare(buildings, budget)
+        
+        sum_area = sum(building.area_with_indent for building in required_buildings)
+        sum_area += sum(building.area_with_indent * amounts[i] for i, building in enumerate(new_buildings))
+        if sum_area < capacity:
+            return KnapsackSolution(required_buildings + [building \
+                for building, amount in zip(new_buildings, amounts) \
+                    for _ in range(amount)])
+        
+        cls.__clamp_amounts(capacity, area, new_buildings, amounts)
         
         # ------------- РЕШАЕТ ОГРАНИЧЕННЫЙ РЮКЗАК С ЛУЧШИМ РЕШЕНИЕМ ------------
-        W = int(round(capacity - area)) // 100
-        table = [[0.0 for _ in range(W + 1)] for _ in range(len(new_buildings) + 1)]
-        for i, building in enumerate(new_buildings):
-            for c in range(1, W + 1):
-                table[i + 1][c] = table[i][c]
-                for k in range(1, amounts[i] + 1):
-                    if c >= int(k * building.area_with_indent // 100):
-                        table[i + 1][c] = max(
-                            table[i + 1][c],
-                            table[i][c - k * int(building.area_with_indent) // 100] + k * building.profit
-                        )
-
-        solution = required_buildings
-        for i in range(len(new_buildings), 0, -1):
-            for k in range(amounts[i - 1], 0, -1):
-                if W >= int(k * new_buildings[i - 1].area_with_indent // 100):
-                    if table[i][W] == table[i - 1][W - k * int(new_buildings[i - 1].area_with_indent) // 100] + k * new_buildings[i - 1].profit:
-                        solution.extend([new_buildings[i - 1]] * k)
-                        W -= k * int(new_buildings[i - 1].area_with_indent // 100)
-                        break
-        return solution
+        footprints = cls._get_footprints(new_buildings)
+        quantum = cls._get_quantum(footprints, resolution)
+        W = int(round(capacity - area)) // quantum
+        weights = cls._get_weights(footprints, quantum)
+        profits = cls._get_profits(new_buildings)
+        counts = cls._solve_counts(weights, profits, amounts, W, engine, strategy)
+        
+        rows = len(cls._convert_to_binary_knapsack(amounts)) + 1 \
+            if strategy == cls.BINARY_STRATEGY else \
+                len(new_buildings) + 1
+        if strategy == cls.LEAN_STRATEGY:
+            rows = 1
+        
+        solution = cls.__assemble(required_buildings, new_buildings, counts)
+        return KnapsackSolution(solution, quantum, (rows, W + 1))
         
         
         
@@ -0,0 +1,81 @@
+from typing import List, Tuple
+
+
+__all__ = [
+    "BranchAndBoundKnapsack",
+]
+
+
+class BranchAndBoundKnapsack:
+    
+    @classmethod
+    def _sort_by_density(
+        cls,
+        weights: List[float],
+        profits: List[float],
+        amounts: List[int]
+    ) -> List[int]:
+        indices = [i for i in range(len(weights)) if profits[i] > 0 and amounts[i] > 0]
+        return sorted(indices, key=lambda i: profits[i] / weights[i] if weights[i] else float("inf"), reverse=True)
+    
+    @classmethod
+    def _bound(
+        cls,
+        order: List[int],
+        start: int,
+        weights: List[float],
+        profits: List[float],
+        amounts: List[int],
+        capacity: float,
+        value: float
+    ) -> float:
+        for i in order[start:]:
+            if weights[i] * amounts[i] <= capacity:
+                capacity -= weights[i] * amounts[i]
+                value += profits[i] * amounts[i]
+            else:
+                return value + profits[i] * capacity / weights[i]
+        return value
+    
+    @classmethod
+    def _search(
+        cls,
+        order: List[int],
+        start: int,
+        weights: List[float],
+        profits: List[float],
+        amounts: List[int],
+        capacity: float,
+        value: float,
+        counts: List[int],
+        best: List[Tuple[float, List[int]]]
+    ) -> None:
+        if value > best[0][0]:
+            best[0] = (value, counts.copy())
+        if start == len(order):
+            return
+        if cls._bound(order, start, weights, profits, amounts, capacity, value) <= best[0][0]:
+            return
+        
+        i = order[start]
+        maximum = amounts[i] if weights[i] == 0 else min(amounts[i], int(capacity // weights[i]))
+        for k in range(maximum, -1, -1):
+            counts[i] = k
+            cls._search(
+                order, start + 1, weights, profits, amounts,
+                capacity - k * weights[i], value + k * profits[i], counts, best
+            )
+        counts[i] = 0
+    
+    @classmethod
+    def _solve_counts(
+        cls,
+        weights: List[float],
+        profits: List[float],
+        amounts: List[int],
+        capacity: float
+    ) -> List[int]:
+        order = cls._sort_by_density(weights, profits, amounts)
+        best = [(0.0, [0] * len(weights))]
+        cls._search(order, 0, weights, profits, amounts, capacity, 0.0, [0] * len(weights), best)
+        return best[0][1]
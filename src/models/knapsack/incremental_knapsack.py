@@ -0,0 +1,103 @@
+import numpy as np
+from typing import Hashable, List, Tuple
+
+
+__all__ = [
+    "IncrementalKnapsack",
+]
+
+
+class IncrementalKnapsack:
+
+    __slots__ = [
+        "_keys",
+        "_signatures",
+        "_rows",
+        "_capacity",
+        "_quantum",
+        "_reused_rows",
+        "_computed_rows",
+    ]
+
+    @property
+    def keys(self) -> List[Hashable]:
+        return list(self._keys)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def quantum(self) -> int:
+        return self._quantum
+
+    @property
+    def reused_rows(self) -> int:
+        return self._reused_rows
+
+    @property
+    def computed_rows(self) -> int:
+        return self._computed_rows
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._keys = list()
+        self._signatures = list()
+        self._rows = list()
+        self._capacity = -1
+        self._quantum = None
+        self._reused_rows = 0
+        self._computed_rows = 0
+
+    # ------------------- Order ---------------------------
+
+    def _get_prefix(self, signatures: dict, W: int, quantum: int) -> int:
+        if W > self._capacity or quantum != self._quantum:
+            return 0
+        prefix = 0
+        for key, signature in zip(self._keys, self._signatures):
+            if signatures.get(key) != signature:
+                break
+            prefix += 1
+        return prefix
+
+    def _get_order(self, keys: List[Hashable], signatures: dict, prefix: int) -> List[Hashable]:
+        # Неизменённые позиции сохраняют прежний порядок, изменённые и новые
+        # уходят в конец: при следующей правке пересчитывается меньше строк
+        previous = dict(zip(self._keys, self._signatures))
+        order = self._keys[:prefix]
+        stable = [key for key in self._keys[prefix:] if signatures.get(key) == previous[key]]
+        order.extend(stable)
+        placed = set(order)
+        order.extend(key for key in keys if key not in placed)
+        return order
+
+    def update(
+        self,
+        keys: List[Hashable],
+        signatures: List[Tuple[int, float, int]],
+        W: int,
+        quantum: int
+    ) -> Tuple[List[Hashable], int]:
+        items = dict(zip(keys, signatures))
+        prefix = self._get_prefix(items, W, quantum)
+        order = self._get_order(keys, items, prefix)
+
+        if prefix == 0:
+            self._rows = [np.zeros(W + 1, dtype=np.float64)]
+            self._capacity, self._quantum = W, quantum
+        else:
+            del self._rows[prefix + 1:]
+        self._keys = order
+        self._signatures = [items[key] for key in order]
+        self._reused_rows = prefix
+        self._computed_rows = len(order) - prefix
+        return order, prefix
+
+    def append_row(self, row: np.ndarray) -> None:
+        self._rows.append(row)
+
+    def get_rows(self) -> List[np.ndarray]:
+        return self._rows
@@ -0,0 +1,48 @@
+import math
+from typing import List, Tuple
+
+from ..buildings import Building
+
+
+__all__ = [
+    "KnapsackSolution",
+]
+
+
+class KnapsackSolution(list):
+    
+    __slots__ = [
+        "_quantum",
+        "_table_size",
+    ]
+    
+    @property
+    def quantum(self) -> int:
+        return self._quantum
+    
+    @property
+    def table_size(self) -> Tuple[int, ...]:
+        return self._table_size
+    
+    @property
+    def cells(self) -> int:
+        return math.prod(self.table_size) if self.table_size else 0
+    
+    def __init__(
+        self,
+        buildings: List[Building] = list(),
+        quantum: int = 1,
+        table_size: Tuple[int, ...] = tuple()
+    ) -> None:
+        super().__init__(buildings)
+        self._quantum = quantum
+        self._table_size = tuple(table_size)
+        
+    # ------------------- Output ---------------------------
+    
+    def print_table_size(self) -> str:
+        shape = " x ".join(str(size) for size in self.table_size)
+        return f"Размер таблицы:\t{shape} ({self.cells} ячеек, шаг {self.quantum} м²)"
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} (buildings: {len(self)}, quantum: {self.quantum}, table_size: {self.table_size})"
@@ -1 +1,9 @@
-from .placement import *
\ No newline at end of file
+from .block import *
+from .guillotine_tree import *
+from .packing_bounds import *
+from .placement import *
+from .max_rects import *
+from .skyline import *
+from .exact import *
+from .grid import *
+from .packing_cache import *
\ No newline at end of file
@@ -0,0 +1,34 @@
+from typing import NamedTuple
+
+
+__all__ = [
+    "Block",
+    "Rect",
+]
+
+
+class Block(NamedTuple):
+    
+    title: str
+    indent: int
+    width: int
+    height: int
+    
+    @property
+    def area(self) -> int:
+        return self.width * self.height
+    
+    @property
+    def kind(self) -> tuple:
+        return self.title, self.indent, min(self.width, self.height), max(self.width, self.height)
+    
+    def rotated(self) -> "Block":
+        return self._replace(width=self.height, height=self.width)
+
+
+class Rect(NamedTuple):
+    
+    x: int
+    y: int
+    width: int
+    height: int
@@ -0,0 +1,159 @@
+import time
+from typing import List, Tuple
+
+from .block import Block
+from .placement import Binpacker
+from .max_rects import MaxRectsPacker
+
+
+__all__ = [
+    "ExactPacker",
+]
+
+
+class ExactPacker(Binpacker):
+
+    # Точный перебор по угловым точкам (Martello, Vigo): любую допустимую
+    # упаковку можно получить, ставя блоки по одному в угловые точки
+    # огибающей уже поставленных. Отсечения: одинаковые блоки
+    # взаимозаменяемы, одна и та же частичная упаковка не раскрывается
+    # дважды, а место под огибающей для оставшихся блоков потеряно
+
+    PARALLEL_SEARCH = False
+
+    DEFAULT_NODE_LIMIT = 200_000
+
+    def __init__(self, width: int, height: int, node_limit: int | None = DEFAULT_NODE_LIMIT, time_limit: float | None = None) -> None:
+        super().__init__(width, height, node_limit, time_limit)
+        self._visited = set()
+
+    # ------------------- Envelope ---------------------------
+
+    @staticmethod
+    def _get_front(placed: List[Tuple[int, int, int, int, int]]) -> List[Tuple[int, int]]:
+        front = list()
+        for right, top in sorted(((x + w, y + h) for x, y, w, h, _ in placed), reverse=True):
+            if not front or top > front[-1][1]:
+                front.append((right, top))
+        return front
+
+    @staticmethod
+    def _get_envelope_area(front: List[Tuple[int, int]]) -> int:
+        area, bottom = 0, 0
+        for right, top in front:
+            area += right * (top - bottom)
+            bottom = top
+        return area
+
+    def _get_waste(self, front: List[Tuple[int, int]], side: int) -> int:
+        # Свободная клетка потеряна, если свободная полоса через неё по
+        # горизонтали или по вертикали короче самой короткой стороны
+        # оставшихся блоков
+        width, height = self.root['width'], self.root['height']
+        xs = sorted({0, width} | {right for right, _ in front})
+        ys = sorted({0, height} | {top for _, top in front})
+
+        waste = 0
+        for x, next_x in zip(xs, xs[1:]):
+            column = max((top for right, top in front if right > x), default=0)
+            for y, next_y in zip(ys, ys[1:]):
+                if y < column:
+                    continue
+                row = max((right for right, top in front if top > y), default=0)
+                if width - row < side or height - column < side:
+                    waste += (next_x - x) * (next_y - y)
+        return waste
+
+    @staticmethod
+    def _get_corner_points(front: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        if not front:
+            return [(0, 0)]
+        corners = [(front[0][0], 0)]
+        corners.extend((front[i][0], front[i - 1][1]) for i in range(1, len(front)))
+        corners.append((0, front[-1][1]))
+        return corners
+
+    # ------------------- Search ---------------------------
+
+    def _search_corners(self, kinds, counts, placed, remaining_area, started):
+        if not any(counts):
+            return True
+
+        key = tuple(sorted(placed))
+        if key in self._visited:
+            return False
+        self._visited.add(key)
+
+        front = self._get_front(placed)
+        side = min(min(kinds[k][1][0]) for k in range(len(kinds)) if counts[k])
+        free_area = self.root['width'] * self.root['height'] - self._get_envelope_area(front)
+        if remaining_area > free_area - self._get_waste(front, side):
+            return False
+
+        corners = sorted(self._get_corner_points(front), key=lambda corner: (corner[1], corner[0]))
+        for k, (_, orientations) in enumerate(kinds):
+            if counts[k] == 0:
+                continue
+            for width, height in orientations:
+                for x, y in corners:
+                    if x + width > self.root['width'] or y + height > self.root['height']:
+                        continue
+                    if self._is_exhausted(started):
+                        return None
+                    self.nodes += 1
+
+                    placed.append((x, y, width, height, k))
+                    counts[k] -= 1
+                    result = self._search_corners(kinds, counts, placed, remaining_area - width * height, started)
+                    counts[k] += 1
+                    if result is not False:
+                        return result
+                    placed.pop()
+        return False
+
+    def fittable(self, blocks: List[Block], rotatable: bool = True) -> bool:
+        groups = dict()
+        for block in blocks:
+            groups.setdefault(block.kind if rotatable else block, list()).append(block)
+
+        kinds, counts = list(), list()
+        for group in sorted(groups.values(), key=lambda group: group[0].area, reverse=True):
+            block = group[0]
+            orientations = [(block.width, block.height)]
+            if rotatable and block.width != block.height:
+                orientations.append((block.height, block.width))
+            kinds.append((block, orientations))
+            counts.append(len(group))
+
+        self.placements, self.nodes, self._visited = list(), 0, set()
+        placed = list()
+        result = self._search_corners(kinds, counts, placed, sum(block.area for block in blocks), time.perf_counter())
+        self._visited = set()
+
+        if result is None:
+            self.status = self.UNKNOWN
+            return False
+        if not result:
+            self.status = self.NOT_FITTED
+            return False
+
+        self.status = self.FITTED
+        self.placements = [
+            (kinds[k][0].title, kinds[k][0].indent, width, height, x, y) \
+                for x, y, width, height, k in placed
+        ]
+        return True
+
+    def fit_blocks(self, blocks) -> bool:
+        # Эвристика быстро находит упаковку, если она есть; точный перебор
+        # нужен, чтобы доказать, что упаковки нет
+        screen = MaxRectsPacker(self.root['width'], self.root['height'])
+        if screen.fit_blocks(blocks):
+            self.nodes, self.status, self.placements = 0, self.FITTED, screen.placements
+            return True
+
+        blocks = self._make_block(blocks)
+        self.nodes, self.status = 0, None
+        if not self._precheck(blocks):
+            return False
+        return self.fittable(blocks)
@@ -0,0 +1,115 @@
+import numpy as np
+from typing import List, Tuple
+
+from .block import Block
+from .placement import Binpacker
+
+
+__all__ = [
+    "GridPacker",
+]
+
+
+class GridPacker(Binpacker):
+
+    # Участок растеризуется в булеву маску занятости с шагом 1 м:
+    # mask[y, x] == True — клетка занята или в ней нельзя строить.
+    # Свобода всех окон w x h проверяется разом по интегральному
+    # изображению маски: сумма окна равна нулю — окно свободно
+
+    PARALLEL_SEARCH = False
+
+    def __init__(self, width: int, height: int, mask: np.ndarray | None = None, **kwargs) -> None:
+        super().__init__(width, height, **kwargs)
+        if mask is None:
+            mask = np.zeros((height, width), dtype=bool)
+        if mask.shape != (height, width):
+            message = f"\n\t{self.__class__.__name__}: Размер маски {mask.shape} "
+            message += f"не совпадает с размером участка {(height, width)}!"
+            raise ValueError(message)
+        self.mask = mask.astype(bool, copy=True)
+        self.occupied = self.mask.copy()
+
+    def add_cutout(self, x: int, y: int, width: int, height: int) -> None:
+        self.mask[y:y + height, x:x + width] = True
+        self.occupied[y:y + height, x:x + width] = True
+
+    @property
+    def free_area(self) -> int:
+        return int(self.mask.size - np.count_nonzero(self.mask))
+
+    # ------------------- Windows ---------------------------
+
+    @staticmethod
+    def _integral(occupied: np.ndarray) -> np.ndarray:
+        integral = np.zeros((occupied.shape[0] + 1, occupied.shape[1] + 1), dtype=np.int64)
+        np.cumsum(np.cumsum(occupied, axis=0), axis=1, out=integral[1:, 1:])
+        return integral
+
+    @staticmethod
+    def _free_windows(integral: np.ndarray, width: int, height: int) -> np.ndarray:
+        sums = integral[height:, width:] - integral[:-height, width:] \
+            - integral[height:, :-width] + integral[:-height, :-width]
+        return sums == 0
+
+    def _find_position(self, integral: np.ndarray, width: int, height: int) -> Tuple[int, int] | None:
+        if width > self.root['width'] or height > self.root['height']:
+            return None
+        free = self._free_windows(integral, width, height)
+        index = int(np.argmax(free))
+        if not free.flat[index]:
+            return None
+        y, x = divmod(index, free.shape[1])
+        return x, y
+
+    # ------------------- Packing ---------------------------
+
+    def fittable(self, blocks: List[Block], rotatable: bool = True) -> bool:
+        self.occupied = self.mask.copy()
+        self.placements = list()
+        if sum(block.area for block in blocks) > self.free_area:
+            return False
+
+        for block in blocks:
+            orientations = [(block.width, block.height)]
+            if rotatable and block.width != block.height:
+                orientations.append((block.height, block.width))
+
+            integral = self._integral(self.occupied)
+            best = None
+            for width, height in orientations:
+                position = self._find_position(integral, width, height)
+                if position is not None and (best is None or position[::-1] < best[0][::-1]):
+                    best = (position, width, height)
+            if best is None:
+                self.placements.clear()
+                return False
+
+            (x, y), width, height = best
+            self.occupied[y:y + height, x:x + width] = True
+            self.placements.append((block.title, block.indent, width, height, x, y))
+        return True
+
+    def fit_blocks(self, blocks) -> bool:
+        blocks = self._make_block(blocks)
+        if not self._precheck(blocks):
+            return False
+        for sorting, value in self.generate_sort_permutations():
+            ordered = [block for block, _ in sorting([(block, None) for block in blocks], value)]
+            if self.fittable(ordered, False) or self.fittable(ordered, True):
+                self.status = self.FITTED
+                return True
+        self.status = self.NOT_FITTED
+        return False
+
+    def plot_packing(self, ax):
+        super().plot_packing(ax)
+        ax.imshow(
+            np.ma.masked_where(~self.mask, self.mask),
+            cmap='Greys',
+            alpha=0.5,
+            origin='lower',
+            extent=(0, self.root['width'], 0, self.root['height']),
+            vmin=0,
+            vmax=1
+        )
@@ -0,0 +1,98 @@
+from array import array
+
+
+__all__ = [
+    "GuillotineTree",
+]
+
+
+class GuillotineTree:
+
+    # Дерево гильотинного раскроя в плоских массивах: узел i описан
+    # x[i], y[i], width[i], height[i], used[i], а его потомки down и right
+    # лежат в right[i] - 1 и right[i]. Потомки всегда добавляются в конец
+    # пула, поэтому откат разреза сводится к усечению массивов
+
+    NO_NODE = -1
+
+    __slots__ = [
+        "x",
+        "y",
+        "width",
+        "height",
+        "used",
+        "right",
+        "_log",
+    ]
+
+    def __init__(self, width: int, height: int, x: int = 0, y: int = 0) -> None:
+        self.x = array("q", [x])
+        self.y = array("q", [y])
+        self.width = array("q", [width])
+        self.height = array("q", [height])
+        self.used = bytearray(1)
+        self.right = array("q", [self.NO_NODE])
+        self._log = array("q")
+
+    @classmethod
+    def from_dict(cls, root: dict) -> "GuillotineTree":
+        tree = cls(root["width"], root["height"], root["x"], root["y"])
+        stack = [(root, 0)]
+        while stack:
+            node, index = stack.pop()
+            if not node["used"]:
+                continue
+            down, right = node["down"], node["right"]
+            tree.split(index, right["x"] - node["x"], down["y"] - node["y"])
+            stack.append((down, tree.right[index] - 1))
+            stack.append((right, tree.right[index]))
+        return tree
+
+    def __len__(self) -> int:
+        return len(self.used)
+
+    @property
+    def depth(self) -> int:
+        return len(self._log)
+
+    # ------------------- Search ---------------------------
+
+    def find(self, width: int, height: int) -> int:
+        # Обход в том же порядке, что и рекурсивный поиск: сначала
+        # правое поддерево, затем нижнее
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            if self.used[i]:
+                stack.append(self.right[i] - 1)
+                stack.append(self.right[i])
+            elif width <= self.width[i] and height <= self.height[i]:
+                return i
+        return self.NO_NODE
+
+    # ------------------- Split / unsplit ---------------------------
+
+    def __append(self, x: int, y: int, width: int, height: int) -> None:
+        self.x.append(x)
+        self.y.append(y)
+        self.width.append(width)
+        self.height.append(height)
+        self.used.append(0)
+        self.right.append(self.NO_NODE)
+
+    def split(self, i: int, width: int, height: int) -> None:
+        x, y = self.x[i], self.y[i]
+        self.__append(x, y + height, self.width[i], self.height[i] - height)
+        self.__append(x + width, y, self.width[i] - width, height)
+        self.used[i] = 1
+        self.right[i] = len(self.used) - 1
+        self._log.append(i)
+
+    def unsplit(self) -> int:
+        i = self._log.pop()
+        for values in (self.x, self.y, self.width, self.height, self.right):
+            del values[-2:]
+        del self.used[-2:]
+        self.used[i] = 0
+        self.right[i] = self.NO_NODE
+        return i
@@ -0,0 +1,161 @@
+from typing import List, Tuple
+
+from .block import Block, Rect
+from .placement import Binpacker
+
+
+__all__ = [
+    "MaxRectsPacker",
+]
+
+
+class MaxRectsPacker(Binpacker):
+
+    # Свободное место хранится как набор максимальных (возможно,
+    # пересекающихся) прямоугольников: после размещения каждый задетый
+    # прямоугольник режется на до четырёх частей, вложенные отбрасываются
+
+    PARALLEL_SEARCH = False
+
+    BEST_SHORT_SIDE_FIT = "bssf"
+    BEST_AREA_FIT = "baf"
+    BOTTOM_LEFT = "bl"
+    CONTACT_POINT = "cp"
+    HEURISTICS = [
+        BEST_SHORT_SIDE_FIT,
+        BEST_AREA_FIT,
+        BOTTOM_LEFT,
+        CONTACT_POINT,
+    ]
+
+    def __init__(self, width: int, height: int, heuristic: str | None = None) -> None:
+        super().__init__(width, height)
+        if heuristic is not None and heuristic not in self.HEURISTICS:
+            message = f"\n\t{self.__class__.__name__}: Недопустимая эвристика '{heuristic}'! "
+            message += f"Ожидалась одна из: {', '.join(self.HEURISTICS)}!"
+            raise ValueError(message)
+        self.heuristic = heuristic
+        self.free_rects = list()
+        self.used_rects = list()
+
+    def _reset(self) -> None:
+        self.free_rects = [Rect(0, 0, self.root['width'], self.root['height'])]
+        self.used_rects = list()
+        self.placements = list()
+
+    # ------------------- Scoring ---------------------------
+
+    @staticmethod
+    def _common_length(start: int, end: int, other_start: int, other_end: int) -> int:
+        return max(0, min(end, other_end) - max(start, other_start))
+
+    def _contact(self, x: int, y: int, width: int, height: int) -> int:
+        contact = 0
+        if x == 0 or x + width == self.root['width']:
+            contact += height
+        if y == 0 or y + height == self.root['height']:
+            contact += width
+        for used_x, used_y, used_width, used_height in self.used_rects:
+            if used_x == x + width or used_x + used_width == x:
+                contact += self._common_length(y, y + height, used_y, used_y + used_height)
+            if used_y == y + height or used_y + used_height == y:
+                contact += self._common_length(x, x + width, used_x, used_x + used_width)
+        return contact
+
+    def _score(self, heuristic: str, free: Rect, width: int, height: int) -> Tuple[int, ...]:
+        x, y, free_width, free_height = free
+        short_side = min(free_width - width, free_height - height)
+        long_side = max(free_width - width, free_height - height)
+        if heuristic == self.BEST_SHORT_SIDE_FIT:
+            return short_side, long_side
+        if heuristic == self.BEST_AREA_FIT:
+            return free_width * free_height - width * height, short_side
+        if heuristic == self.BOTTOM_LEFT:
+            return y + height, x
+        return -self._contact(x, y, width, height), y, x
+
+    def _find_position(
+        self,
+        heuristic: str,
+        width: int,
+        height: int,
+        rotatable: bool
+    ) -> Tuple[Tuple[int, ...], int, int, int, int] | None:
+        orientations = [(width, height)]
+        if rotatable and width != height:
+            orientations.append((height, width))
+
+        best = None
+        for free in self.free_rects:
+            for block_width, block_height in orientations:
+                if block_width <= free.width and block_height <= free.height:
+                    score = self._score(heuristic, free, block_width, block_height)
+                    if best is None or score < best[0]:
+                        best = (score, free.x, free.y, block_width, block_height)
+        return best
+
+    # ------------------- Free rectangles ---------------------------
+
+    @staticmethod
+    def _split_free_rect(free: Rect, x: int, y: int, width: int, height: int) -> List[Rect]:
+        free_x, free_y, free_width, free_height = free
+        if x >= free_x + free_width or x + width <= free_x or \
+            y >= free_y + free_height or y + height <= free_y:
+            return [free]
+
+        result = list()
+        if x > free_x:
+            result.append(Rect(free_x, free_y, x - free_x, free_height))
+        if x + width < free_x + free_width:
+            result.append(Rect(x + width, free_y, free_x + free_width - x - width, free_height))
+        if y > free_y:
+            result.append(Rect(free_x, free_y, free_width, y - free_y))
+        if y + height < free_y + free_height:
+            result.append(Rect(free_x, y + height, free_width, free_y + free_height - y - height))
+        return result
+
+    @staticmethod
+    def _contains(outer: Rect, inner: Rect) -> bool:
+        return outer.x <= inner.x and outer.y <= inner.y and \
+            inner.x + inner.width <= outer.x + outer.width and \
+                inner.y + inner.height <= outer.y + outer.height
+
+    def _place(self, x: int, y: int, width: int, height: int) -> None:
+        free_rects = list()
+        for free in self.free_rects:
+            free_rects.extend(self._split_free_rect(free, x, y, width, height))
+
+        free_rects = list(dict.fromkeys(free_rects))
+        self.free_rects = [
+            free for i, free in enumerate(free_rects) \
+                if not any(j != i and self._contains(other, free) for j, other in enumerate(free_rects))
+        ]
+        self.used_rects.append(Rect(x, y, width, height))
+
+    # ------------------- Packing ---------------------------
+
+    def fittable(self, blocks: List[Block], rotatable: bool = True, heuristic: str = BEST_SHORT_SIDE_FIT) -> bool:
+        self._reset()
+        for block in blocks:
+            position = self._find_position(heuristic, block.width, block.height, rotatable)
+            if position is None:
+                self.placements.clear()
+                return False
+            _, x, y, width, height = position
+            self._place(x, y, width, height)
+            self.placements.append((block.title, block.indent, width, height, x, y))
+        return True
+
+    def fit_blocks(self, blocks) -> bool:
+        blocks = self._make_block(blocks)
+        if not self._precheck(blocks):
+            return False
+        heuristics = self.HEURISTICS if self.heuristic is None else [self.heuristic]
+        for sorting, value in self.generate_sort_permutations():
+            ordered = [block for block, _ in sorting([(block, None) for block in blocks], value)]
+            for heuristic in heuristics:
+                if self.fittable(ordered, True, heuristic):
+                    self.status = self.FITTED
+                    return True
+        self.status = self.NOT_FITTED
+        return False
@@ -0,0 +1,54 @@
+from typing import List, Tuple
+
+
+__all__ = [
+    "PackingBounds",
+]
+
+
+class PackingBounds:
+
+    # Необходимые условия размещения прямоугольников width x height в одном
+    # контейнере с разрешённым поворотом; каждая проверка выполняется за O(n)
+
+    AREA_REASON = "Суммарная площадь блоков превышает площадь участка"
+    DIMENSION_REASON = "Блок не помещается на участок ни в одной ориентации"
+    STRIP_REASON = "Широкие блоки не помещаются друг над другом"
+
+    @classmethod
+    def _orientations(cls, width: int, height: int, size: Tuple[int, int]) -> List[Tuple[int, int]]:
+        return [(w, h) for w, h in {size, size[::-1]} if w <= width and h <= height]
+
+    @classmethod
+    def check_area(cls, width: int, height: int, sizes: List[Tuple[int, int]]) -> bool:
+        return sum(w * h for w, h in sizes) <= width * height
+
+    @classmethod
+    def check_dimensions(cls, width: int, height: int, sizes: List[Tuple[int, int]]) -> bool:
+        return all(cls._orientations(width, height, size) for size in sizes)
+
+    @classmethod
+    def _check_strip(cls, width: int, height: int, sizes: List[Tuple[int, int]]) -> bool:
+        # Блоки шире половины участка в любой допустимой ориентации не могут
+        # стоять рядом, поэтому их высоты складываются
+        total = 0
+        for size in sizes:
+            orientations = cls._orientations(width, height, size)
+            if orientations and all(2 * w > width for w, _ in orientations):
+                total += min(h for _, h in orientations)
+        return total <= height
+
+    @classmethod
+    def check_strips(cls, width: int, height: int, sizes: List[Tuple[int, int]]) -> bool:
+        transposed = [(h, w) for w, h in sizes]
+        return cls._check_strip(width, height, sizes) and cls._check_strip(height, width, transposed)
+
+    @classmethod
+    def check(cls, width: int, height: int, sizes: List[Tuple[int, int]]) -> str | None:
+        if not cls.check_area(width, height, sizes):
+            return cls.AREA_REASON
+        if not cls.check_dimensions(width, height, sizes):
+            return cls.DIMENSION_REASON
+        if not cls.check_strips(width, height, sizes):
+            return cls.STRIP_REASON
+        return None
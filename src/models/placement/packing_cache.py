@@ -0,0 +1,112 @@
+import os
+import json
+from collections import OrderedDict
+from typing import List, Tuple
+
+from .block import Block
+from .placement import Binpacker
+
+
+__all__ = [
+    "PackingCache",
+]
+
+
+class PackingCache:
+
+    # LRU-кэш удачных упаковок: ключ — тип упаковщика, размеры участка и
+    # отсортированный набор блоков; при заданном пути кэш хранится в JSON
+
+    DEFAULT_MAXSIZE = 256
+
+    PROJECT_DIR = os.getcwd()
+    CURRENT_DIR = os.path.join(PROJECT_DIR, "src", "models", "placement")
+    FILE_PATH = os.path.join(CURRENT_DIR, "packing_cache.json")
+
+    def __init__(self, path: str | None = None, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------- Keys ---------------------------
+
+    @staticmethod
+    def make_key(packer: Binpacker, blocks: List[Block]) -> Tuple:
+        return (
+            packer.__class__.__name__,
+            packer.root['width'],
+            packer.root['height'],
+            tuple(sorted(tuple(block) for block in blocks)),
+        )
+
+    # ------------------- LRU ---------------------------
+
+    def get(self, key: Tuple) -> List[Tuple] | None:
+        placements = self._entries.get(key)
+        if placements is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return list(placements)
+
+    def put(self, key: Tuple, placements: List[Tuple]) -> None:
+        self._entries[key] = [tuple(placement) for placement in placements]
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        if self.path is not None:
+            self._save()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    # ------------------- Packer ---------------------------
+
+    def load(self, packer: Binpacker, buildings: List) -> bool:
+        placements = self.get(self.make_key(packer, packer._make_block(buildings)))
+        if placements is None:
+            return False
+        packer.placements, packer.status, packer.nodes = placements, Binpacker.FITTED, 0
+        return True
+
+    def store(self, packer: Binpacker, buildings: List) -> None:
+        self.put(self.make_key(packer, packer._make_block(buildings)), packer.placements)
+
+    def fit(self, packer: Binpacker, buildings: List) -> bool:
+        if self.load(packer, buildings):
+            return True
+        if not packer.fit_blocks(buildings):
+            return False
+        self.store(packer, buildings)
+        return True
+
+    # ------------------- Persistence ---------------------------
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return
+        for name, width, height, blocks, placements in entries[-self.maxsize:]:
+            key = (name, width, height, tuple(tuple(block) for block in blocks))
+            self._entries[key] = [tuple(placement) for placement in placements]
+
+    def _save(self) -> None:
+        entries = [[*key, placements] for key, placements in self._entries.items()]
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(entries, file, ensure_ascii=False)
+        os.replace(temporary, self.path)
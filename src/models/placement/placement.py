@@ -1,8 +1,14 @@
-import copy
+import time
 import random
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
+from .block import Block
+from .guillotine_tree import GuillotineTree
+from .packing_bounds import PackingBounds
 from ..buildings import Building
 
 
@@ -13,154 +19,257 @@ __all__ = [
 
 class Binpacker:
     
-    def __init__(self, width, height):
+    FITTED = "fitted"
+    NOT_FITTED = "not fitted"
+    UNKNOWN = "unknown"
+    
+    DEFAULT_NODE_LIMIT = 20_000
+    
+    # Параллельно выполняется только гильотинный перебор _search;
+    # упаковщики со своим поиском выставляют False и в
+    # fit_blocks_parallel выполняют обычный fit_blocks
+    PARALLEL_SEARCH = True
+    
+    # Пул процессов и флаг остановки общие для всех вызовов
+    # fit_blocks_parallel; в процессах пула флаг попадает в _stop_event
+    _executor = None
+    _executor_workers = None
+    _executor_event = None
+    _executor_lock = threading.Lock()
+    _stop_event = None
+    
+    def __init__(self, width, height, node_limit=DEFAULT_NODE_LIMIT, time_limit=None):
         self.root = {'width': width, 'height': height, 'x': 0, 'y': 0, 'used': False}
         self.placements = []
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.nodes = 0
+        self.status = None
+        self.reason = None
 
     def sort_blocks_by_title(self, blocks, is_reverse):
-        return sorted(blocks, key=lambda block: block[0]['title'], reverse=is_reverse)
+        return sorted(blocks, key=lambda block: block[0].title, reverse=is_reverse)
     
     def sort_blocks_by_area(self, blocks, is_reverse):
         # return sorted(blocks, key=lambda block: block['height'] * block['width'], reverse=is_reverse)
-        return sorted(blocks, key=lambda block: block[0]['height'] * block[0]['width'], reverse=is_reverse)
+        return sorted(blocks, key=lambda block: block[0].area, reverse=is_reverse)
 
     def sort_blocks_by_width(self, blocks, is_reverse):
         # return sorted(blocks, key=lambda block: block['width'], reverse=is_reverse)
-        return sorted(blocks, key=lambda block: block[0]['width'], reverse=is_reverse)
+        return sorted(blocks, key=lambda block: block[0].width, reverse=is_reverse)
 
     def sort_blocks_by_height(self, blocks, is_reverse):
         # return sorted(blocks, key=lambda block: block['height'], reverse=is_reverse)
-        return sorted(blocks, key=lambda block: block[0]['height'], reverse=is_reverse)
+        return sorted(blocks, key=lambda block: block[0].height, reverse=is_reverse)
 
-    def __make_block(self, blocks):
-        result = list()
-        for block in blocks:
-            result.append(
-                {
-                    "title": str(block.title),
-                    "indent": int(block.indent),
-                    "width": int(block.width + 2 * block.indent),
-                    "height": int(block.length + 2 * block.indent),
-                }
-            )
-        return result
+    def _make_block(self, blocks):
+        return [
+            Block(
+                str(block.title),
+                int(block.indent),
+                int(block.width + 2 * block.indent),
+                int(block.length + 2 * block.indent),
+            ) for block in blocks
+        ]
 
     def fittable(self, blocks, rotatable=False, root=None):
-        if root is None:
-            root = self.root
-        if not blocks:
-            return True
+        tree = GuillotineTree.from_dict(self.root if root is None else root)
+        orientations = 2 if rotatable else 1
+        attempts = [0] * len(blocks)
         
-        def fit_block(root, block_title, block_indent, block_width, block_height):
-            tail = blocks[1:] 
-            node = self.__find_node(root, block_width, block_height)
-            if node is None:
+        i = 0
+        while i < len(blocks):
+            block = blocks[i]
+            node = GuillotineTree.NO_NODE
+            while node == GuillotineTree.NO_NODE and attempts[i] < orientations:
+                width, height = (block.width, block.height) if attempts[i] == 0 else (block.height, block.width)
+                attempts[i] += 1
+                if attempts[i] == 2 and width == height:
+                    break
+                node = tree.find(width, height)
+            
+            if node != GuillotineTree.NO_NODE:
+                tree.split(node, width, height)
+                self.placements.append((block.title, block.indent, width, height, tree.x[node], tree.y[node]))
+                i += 1
+                continue
+            
+            attempts[i] = 0
+            i -= 1
+            if i < 0:
                 return False
-            else:
-                self.__split_node(node, block_width, block_height)
-                self.placements.append((block_title, block_indent, block_width, block_height, node['x'], node['y']))
-                return self.fittable(tail, rotatable, root)
-
-        block = blocks[0]
-        return fit_block(copy.deepcopy(root), block['title'], block['indent'], block['width'], block['height']) or \
-            (rotatable and fit_block(copy.deepcopy(root), block['title'], block['indent'], block['height'], block['width']))
-
-    def __find_node(self, root, width, height):
-        if not 'used' in root:
-            print(root)
-        if root['used']:
-            return self.__find_node(root['right'], width, height) or self.__find_node(root['down'], width, height)
-        elif width <= root['width'] and height <= root['height']:
-            return root
-        else:
-            return None
-
-    def __split_node(self, node, width, height):
-        node['used'] = True
-        node['down'] = {'x': node['x'], 'y': node['y'] + height, 'width': node['width'], 'height': node['height'] - height, 'used': False}
-        node['right'] = {'x': node['x'] + width, 'y': node['y'], 'width': node['width'] - width, 'height': height, 'used': False}
-        return node
+            tree.unsplit()
+            self.placements.pop()
+        return True
 
+    def _block_kind(self, block):
+        return block.kind
+    
+    def _rotation_groups(self, blocks):
+        # Эвристика: в группе одинаковых блоков перебирается лишь число
+        # повёрнутых, и поворачиваются первые блоки группы. Для fittable
+        # порядок важен, поворот второй копии вместо первой даёт другую
+        # раскладку, поэтому часть упаковок этим перебором не находится
+        groups = dict()
+        for i, block in enumerate(blocks):
+            if block.width != block.height:
+                groups.setdefault(self._block_kind(block), []).append(i)
+        return sorted(groups.values(), key=lambda group: blocks[group[0]].area, reverse=True)
+    
+    def _rotation_states(self, groups, rotations, start=0):
+        # Число повёрнутых блоков в каждой группе при заданной сумме
+        # rotations; крупные блоки поворачиваются раньше мелких
+        if start == len(groups):
+            if rotations == 0:
+                yield []
+            return
+        for rotated in range(min(rotations, len(groups[start])), -1, -1):
+            for rest in self._rotation_states(groups, rotations - rotated, start + 1):
+                yield [rotated] + rest
+    
+    def _rotate(self, blocks, groups, state):
+        blocks = list(blocks)
+        for group, rotated in zip(groups, state):
+            for i in group[:rotated]:
+                blocks[i] = blocks[i].rotated()
+        return blocks
+    
+    def _generate_orders(self, blocks):
+        orders = [
+            [block for block, _ in sorting([(block, None) for block in blocks], value)] \
+                for sorting, value in self.generate_sort_permutations()
+        ]
+        for _ in range(len(blocks)):
+            orders.append(orders[-1][1:] + orders[-1][:1])
+        
+        unique = dict()
+        for order in orders:
+            unique.setdefault(tuple(self._block_kind(block) + (block.width,) for block in order), order)
+        return list(unique.values())
+    
+    def _is_exhausted(self, started):
+        if self._stop_event is not None and self._stop_event.is_set():
+            return True
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            return True
+        return self.time_limit is not None and time.perf_counter() - started >= self.time_limit
+    
+    def _precheck(self, blocks):
+        sizes = [(block.width, block.height) for block in blocks]
+        self.reason = PackingBounds.check(self.root['width'], self.root['height'], sizes)
+        if self.reason is None:
+            return True
+        self.placements = []
+        self.status = self.NOT_FITTED
+        return False
+    
+    def _search(self, orders):
+        started = time.perf_counter()
+        
+        # Сначала все порядки без поворотов, затем с одним поворотом и т. д.
+        # Перебор неполон (см. _rotation_groups): NOT_FITTED здесь значит
+        # «не найдено», а не доказательство того, что упаковки нет
+        orders = [(order, self._rotation_groups(order)) for order in orders]
+        rotatable = sum(1 for block in orders[0][0] if block.width != block.height) if orders else 0
+        for rotations in range(rotatable + 1):
+            for order, groups in orders:
+                for state in self._rotation_states(groups, rotations):
+                    if self._is_exhausted(started):
+                        self.status = self.UNKNOWN
+                        return False
+                    self.nodes += 1
+                    if self.fittable(self._rotate(order, groups, state)):
+                        self.status = self.FITTED
+                        return True
+                    self.placements.clear()
+        
+        self.status = self.NOT_FITTED
+        return False
+    
     def fit_blocks(self, blocks):
-        blocks = self.__make_block(blocks)
-
-        rotations = [0] * len(blocks) 
-        max_rotations = [1 if blocks[i]['width'] != blocks[i]['height'] else 0 for i in range(len(blocks))]
+        blocks = self._make_block(blocks)
+        self.nodes, self.status = 0, None
+        if not self._precheck(blocks):
+            return False
+        return self._search(self._generate_orders(blocks))
+    
+    # ------------------- Parallel packing ---------------------------
+    
+    @staticmethod
+    def _init_worker(event):
+        Binpacker._stop_event = event
+    
+    @classmethod
+    def _get_executor(cls, max_workers):
+        if Binpacker._executor is None or Binpacker._executor_workers != max_workers:
+            cls.shutdown_executor()
+            Binpacker._executor_event = multiprocessing.Event()
+            Binpacker._executor = ProcessPoolExecutor(
+                max_workers, 
+                initializer=Binpacker._init_worker, 
+                initargs=(Binpacker._executor_event,)
+            )
+            Binpacker._executor_workers = max_workers
+        return Binpacker._executor
+    
+    @classmethod
+    def shutdown_executor(cls):
+        if Binpacker._executor is not None:
+            Binpacker._executor.shutdown(wait=True, cancel_futures=True)
+        Binpacker._executor = None
+        Binpacker._executor_workers = None
+        Binpacker._executor_event = None
+    
+    @staticmethod
+    def _fit_order(width, height, order, node_limit, time_limit):
+        packer = Binpacker(width, height, node_limit, time_limit)
+        Binpacker._search(packer, [list(order)])
+        return packer.status, packer.nodes, packer.placements
+    
+    def fit_blocks_parallel(self, blocks, max_workers=None):
+        # Каждый порядок блоков перебирается в отдельном процессе;
+        # после первой найденной упаковки ожидающие задачи отменяются,
+        # а выполняющиеся останавливаются по общему флагу
+        if not self.PARALLEL_SEARCH:
+            return self.fit_blocks(blocks)
         
-        sort_permutations = self.generate_sort_permutations()
-        for sorting, value in sort_permutations:
-            combined = list(zip(blocks, max_rotations))
-            combined_sorted = sorting(combined, value)
-            blocks, max_rotations = zip(*combined_sorted)
-            blocks, max_rotations = list(blocks), list(max_rotations)
-            while True:
-                if self.fittable(blocks):
-                    return True
-                self.placements.clear()
-                
-                rotated = False
-                for i in range(len(blocks)):
-                    if rotations[i] < max_rotations[i]:
-                        blocks[i]['width'], blocks[i]['height'] = blocks[i]['height'], blocks[i]['width']
-                        rotations[i] += 1
-                        rotated = True
-                        break
-                    else:
-                        blocks[i]['width'], blocks[i]['height'] = blocks[i]['height'], blocks[i]['width']
-                        rotations[i] = 0
-                
-                if not rotated:
-                    break
+        blocks = self._make_block(blocks)
+        self.nodes, self.status = 0, None
+        if not self._precheck(blocks):
+            return False
         
-        for _ in range(len(blocks)):
-            blocks = blocks[1:] + blocks[:1]
-            max_rotations = max_rotations[1:] + max_rotations[:1]
-            while True:
-                if self.fittable(blocks):
-                    return True
-                self.placements.clear()
-                
-                rotated = False
-                for i in range(len(blocks)):
-                    if rotations[i] < max_rotations[i]:
-                        blocks[i]['width'], blocks[i]['height'] = blocks[i]['height'], blocks[i]['width']
-                        rotations[i] += 1
-                        rotated = True
-                        break
-                    else:
-                        blocks[i]['width'], blocks[i]['height'] = blocks[i]['height'], blocks[i]['width']
-                        rotations[i] = 0
-                
-                if not rotated:
-                    break
+        statuses = set()
+        with Binpacker._executor_lock:
+            executor = self._get_executor(max_workers)
+            event = Binpacker._executor_event
+            event.clear()
+            futures = [
+                executor.submit(
+                    Binpacker._fit_order,
+                    self.root['width'], 
+                    self.root['height'], 
+                    order,
+                    self.node_limit,
+                    self.time_limit
+                ) for order in self._generate_orders(blocks)
+            ]
+            try:
+                for future in as_completed(futures):
+                    status, nodes, placements = future.result()
+                    self.nodes += nodes
+                    statuses.add(status)
+                    if status == self.FITTED:
+                        self.placements, self.status = placements, self.FITTED
+                        return True
+            finally:
+                event.set()
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+        
+        self.status = self.UNKNOWN if self.UNKNOWN in statuses else self.NOT_FITTED
+        return False
         
-        # sort_permutations = self.generate_sort_permutations()
-        # while True:
-        #     for _ in range(3):
-        #         random.shuffle(blocks)
-        #         if self.fittable(blocks):
-        #             return True
-        #         self.placements.clear()
-            
-        #     for sorting, value in sort_permutations:
-        #         if self.fittable(sorting(blocks, value)):
-        #             return True
-        #         self.placements.clear()
-                
-        #     rotated = False
-        #     for i in range(len(blocks)):
-        #         if rotations[i] < max_rotations[i]:
-        #             blocks[i]['width'], blocks[i]['height'] = blocks[i]['height'], blocks[i]['width']
-        #             rotations[i] += 1
-        #             rotated = True
-        #             break
-        #         else:
-        #             blocks[i]['width'], blocks[i]['height'] = blocks[i]['height'], blocks[i]['width']
-        #             rotations[i] = 0
-            
-        #     if not rotated:
-        #         break
-
     def generate_sort_permutations(self):
         return [
             (self.sort_blocks_by_area, True),
@@ -0,0 +1,145 @@
+from collections import deque
+from typing import List, Tuple
+
+from .block import Block
+from .placement import Binpacker
+
+
+__all__ = [
+    "SkylinePacker",
+    "StagedPacker",
+]
+
+
+class SkylinePacker(Binpacker):
+
+    # Верхняя граница занятой области хранится как ломаная из отрезков
+    # [x, y, width]; блок ставится туда, где его верх окажется ниже всего
+
+    PARALLEL_SEARCH = False
+
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__(width, height)
+        self.skyline = list()
+
+    def generate_sort_permutations(self):
+        return [
+            (self.sort_blocks_by_height, True),
+            (self.sort_blocks_by_area, True),
+            (self.sort_blocks_by_width, True),
+        ]
+
+    def _find_position(self, width: int, height: int) -> Tuple[int, int, int] | None:
+        # Окно отрезков под блоком только сдвигается вправо, поэтому
+        # максимум высоты в нём ведётся монотонной очередью за O(S)
+        best = None
+        window, end = deque(), 0
+        for i, (x, _, _) in enumerate(self.skyline):
+            if x + width > self.root['width']:
+                break
+            while end < len(self.skyline) and self.skyline[end][0] < x + width:
+                while window and self.skyline[window[-1]][1] <= self.skyline[end][1]:
+                    window.pop()
+                window.append(end)
+                end += 1
+            while window and window[0] < i:
+                window.popleft()
+            y = self.skyline[window[0]][1] if window else 0
+            if y + height <= self.root['height'] and (best is None or (y + height, x) < best[:2]):
+                best = (y + height, x, y)
+        return best
+
+    def _place(self, x: int, y: int, width: int, height: int) -> None:
+        skyline = list()
+        for segment_x, segment_y, segment_width in self.skyline:
+            if segment_x < x:
+                skyline.append([segment_x, segment_y, min(segment_width, x - segment_x)])
+            if segment_x + segment_width > x + width:
+                start = max(segment_x, x + width)
+                skyline.append([start, segment_y, segment_x + segment_width - start])
+        skyline.append([x, y + height, width])
+        skyline.sort()
+
+        self.skyline = list()
+        for segment in skyline:
+            if self.skyline and self.skyline[-1][1] == segment[1]:
+                self.skyline[-1][2] += segment[2]
+            else:
+                self.skyline.append(segment)
+
+    def fittable(self, blocks: List[Block], rotatable: bool = True) -> bool:
+        self.skyline = [[0, 0, self.root['width']]]
+        self.placements = list()
+        for block in blocks:
+            orientations = [(block.width, block.height)]
+            if rotatable and block.width != block.height:
+                orientations.append((block.height, block.width))
+
+            best = None
+            for width, height in orientations:
+                position = self._find_position(width, height)
+                if position is not None and (best is None or position[:2] < best[0][:2]):
+                    best = (position, width, height)
+            if best is None:
+                self.placements.clear()
+                return False
+
+            (_, x, y), width, height = best
+            self._place(x, y, width, height)
+            self.placements.append((block.title, block.indent, width, height, x, y))
+        return True
+
+    def fit_blocks(self, blocks) -> bool:
+        blocks = self._make_block(blocks)
+        if not self._precheck(blocks):
+            return False
+        for sorting, value in self.generate_sort_permutations():
+            ordered = [block for block, _ in sorting([(block, None) for block in blocks], value)]
+            # Жадный выбор поворота может испортить ряд одинаковых блоков,
+            # поэтому сначала пробуется исходная ориентация
+            if self.fittable(ordered, False) or self.fittable(ordered, True):
+                self.status = self.FITTED
+                return True
+        self.status = self.NOT_FITTED
+        return False
+
+
+class StagedPacker(Binpacker):
+
+    # Быстрый отсев: skyline отвечает «помещается» для большинства наборов,
+    # полный перебор Binpacker запускается только при его отказе
+
+    PRECHECK_STAGE = "precheck"
+    SKYLINE_STAGE = "skyline"
+    EXHAUSTIVE_STAGE = "exhaustive"
+
+    def __init__(
+        self, 
+        width: int, 
+        height: int, 
+        node_limit: int | None = Binpacker.DEFAULT_NODE_LIMIT, 
+        time_limit: float | None = None
+    ) -> None:
+        super().__init__(width, height, node_limit, time_limit)
+        self.stage = None
+
+    def _fit_staged(self, blocks, search) -> bool:
+        if not self._precheck(self._make_block(blocks)):
+            self.stage = self.PRECHECK_STAGE
+            return False
+        
+        screen = SkylinePacker(self.root['width'], self.root['height'])
+        if screen.fit_blocks(blocks):
+            self.stage = self.SKYLINE_STAGE
+            self.status = self.FITTED
+            self.placements = screen.placements
+            return True
+
+        self.stage = self.EXHAUSTIVE_STAGE
+        return bool(search(blocks))
+
+    def fit_blocks(self, blocks) -> bool:
+        return self._fit_staged(blocks, super().fit_blocks)
+
+    def fit_blocks_parallel(self, blocks, max_workers=None) -> bool:
+        return self._fit_staged(blocks, lambda blocks: super(StagedPacker, self).fit_blocks_parallel(blocks, max_workers))
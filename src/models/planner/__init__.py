@@ -0,0 +1 @@
+from .placement_planner import *
\ No newline at end of file
@@ -0,0 +1,270 @@
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from ..price import Price
+from ..surface import Surface
+from ..knapsack import BoundedKnapsack
+from ..buildings import Building, Apartment, Shop
+from ..placement import Binpacker, ExactPacker, PackingBounds, PackingCache, StagedPacker
+
+from ...validators import Validator, IntValidator, is_validation_enabled
+
+
+__all__ = [
+    "PlacementPlanner",
+]
+
+
+class PlacementPlanner:
+    
+    __slots__ = [
+        "_surface",
+        "_solutions_amount",
+        "_packer_type",
+        "_cache",
+        "_resolution",
+        "_engine",
+        "_feasible",
+        "_unfitted",
+        "_infeasible",
+        "packings",
+        "cache_hits",
+        "pruned",
+        "unknown",
+        "rejected",
+        "stages",
+    ]
+    
+    @property
+    def class_name(self) -> str:
+        return self.__class__.__name__
+    
+    @property
+    def surface(self) -> Surface:
+        return self._surface
+    
+    @surface.setter
+    def surface(self, surface: Surface) -> None:
+        s = f"\n\t{self.class_name}: "
+        
+        handler = Validator._handle_exception
+        handler(Validator.validate_object_type, s, surface, Surface)
+        
+        self._surface = surface
+        self._feasible = dict()
+        self._unfitted = set()
+        self._infeasible = list()
+        
+    @property
+    def solutions_amount(self) -> int:
+        return self._solutions_amount
+    
+    @solutions_amount.setter
+    def solutions_amount(self, solutions_amount: int) -> None:
+        s = f"\n\t{self.class_name}: "
+        
+        handler = IntValidator._handle_exception
+        handler(IntValidator.validate, s, solutions_amount, 1)
+        
+        self._solutions_amount = solutions_amount
+        
+    @property
+    def packer_type(self) -> type[Binpacker]:
+        return self._packer_type
+    
+    @packer_type.setter
+    def packer_type(self, packer_type: type[Binpacker]) -> None:
+        s = f"\n\t{self.class_name}: "
+        
+        if is_validation_enabled() and \
+            (not isinstance(packer_type, type) or not issubclass(packer_type, Binpacker)):
+            raise TypeError(s + f"Ожидался класс упаковщика, получено {packer_type}!")
+        
+        self._packer_type = packer_type
+        self._feasible = dict()
+        self._unfitted = set()
+        self._infeasible = list()
+        
+    @property
+    def cache(self) -> PackingCache | None:
+        return self._cache
+    
+    @cache.setter
+    def cache(self, cache: PackingCache | None) -> None:
+        s = f"\n\t{self.class_name}: "
+        
+        handler = Validator._handle_exception
+        handler(Validator.validate_object_type, s, cache, PackingCache | None)
+        
+        self._cache = cache
+        
+    @property
+    def resolution(self) -> int | str:
+        return self._resolution
+    
+    @resolution.setter
+    def resolution(self, resolution: int | str) -> None:
+        s = f"\n\t{self.class_name}: "
+        BoundedKnapsack._validate_resolution(resolution, s)
+        
+        self._resolution = resolution
+        
+    @property
+    def engine(self) -> str:
+        return self._engine
+    
+    @engine.setter
+    def engine(self, engine: str) -> None:
+        s = f"\n\t{self.class_name}: "
+        BoundedKnapsack._validate_choice(engine, BoundedKnapsack.ENGINES, s)
+        
+        self._engine = engine
+        
+    def __init__(
+        self, 
+        surface: Surface, 
+        solutions_amount: int = BoundedKnapsack.DEFAULT_SOLUTIONS_AMOUNT,
+        packer_type: type[Binpacker] = StagedPacker,
+        cache: PackingCache | None = None,
+        resolution: int | str = BoundedKnapsack.CAPACITY_QUANTUM,
+        engine: str = BoundedKnapsack.NUMPY_ENGINE
+    ) -> None:
+        self.surface = surface
+        self.solutions_amount = solutions_amount
+        self.packer_type = packer_type
+        self.cache = cache
+        self.resolution = resolution
+        self.engine = engine
+        self.packings = 0
+        self.cache_hits = 0
+        self.pruned = 0
+        self.unknown = 0
+        self.rejected = 0
+        self.stages = Counter()
+        
+    # ------------------- Feasibility ---------------------------
+    
+    @staticmethod
+    def _block_key(building: Building) -> Tuple[str, int, int, int]:
+        return (
+            str(building.title),
+            int(building.indent),
+            int(building.width_with_indent),
+            int(building.length_with_indent),
+        )
+    
+    def _make_packer(self) -> Binpacker:
+        return self.packer_type(int(self.surface.width), int(self.surface.length))
+    
+    @staticmethod
+    def _is_proven(packer: Binpacker) -> bool:
+        # Отказ доказан только оценками PackingBounds или точным
+        # перебором; эвристики и гильотинный поиск неполны, и надмножество
+        # их неудачного набора может поместиться
+        return packer.reason is not None or isinstance(packer, ExactPacker)
+    
+    def _fit(self, buildings: List[Building]) -> Binpacker | None:
+        multiset = Counter(self._block_key(building) for building in buildings)
+        key = tuple(sorted(multiset.items()))
+        
+        if key in self._feasible:
+            self.cache_hits += 1
+            packer = self._make_packer()
+            packer.placements = list(self._feasible[key])
+            return packer
+        if key in self._unfitted:
+            self.cache_hits += 1
+            return None
+        if any(all(multiset[block] >= amount for block, amount in infeasible.items()) \
+            for infeasible in self._infeasible):
+            self.pruned += 1
+            return None
+        
+        packer = self._make_packer()
+        if self.cache is not None and self.cache.load(packer, buildings):
+            self.cache_hits += 1
+            self._feasible[key] = list(packer.placements)
+            return packer
+        
+        sizes = [(width, length) for _, _, width, length in multiset.elements()]
+        if PackingBounds.check(int(self.surface.width), int(self.surface.length), sizes) is not None:
+            self.rejected += 1
+            self._add_infeasible(multiset)
+            return None
+        
+        self.packings += 1
+        fitted = packer.fit_blocks(buildings)
+        if isinstance(packer, StagedPacker):
+            self.stages[packer.stage] += 1
+        if fitted:
+            self._feasible[key] = list(packer.placements)
+            if self.cache is not None:
+                self.cache.store(packer, buildings)
+            return packer
+        if packer.status == Binpacker.UNKNOWN:
+            self.unknown += 1
+            return None
+        
+        if self._is_proven(packer):
+            self._add_infeasible(multiset)
+        else:
+            self._unfitted.add(key)
+        return None
+    
+    def _add_infeasible(self, multiset: Counter) -> None:
+        self._infeasible = [infeasible for infeasible in self._infeasible \
+            if not all(infeasible[block] >= amount for block, amount in multiset.items())]
+        self._infeasible.append(multiset)
+    
+    # ------------------- Planning ---------------------------
+    
+    def _reduce(
+        self, 
+        solution: List[Building],
+        profits: Dict[int, float]
+    ) -> Tuple[List[Building], Binpacker] | None:
+        solution = list(solution)
+        while True:
+            packer = self._fit(solution)
+            if packer is not None:
+                return solution, packer
+            
+            optional = [i for i, building in enumerate(solution) if isinstance(building, Apartment | Shop)]
+            if not optional:
+                return None
+            index = min(optional, key=lambda i: (profits[id(solution[i])], -i))
+            solution = solution[:index] + solution[index + 1:]
+    
+    def plan(
+        self, 
+        buildings: List[Building], 
+        budget: Price
+    ) -> Tuple[List[Building], Binpacker]:
+        s = f"\n\t{self.class_name}.plan: "
+        self.surface.validate_placement_buildings(buildings)
+        
+        profits = {id(building): float(building.profit) \
+            for building in buildings if isinstance(building, Apartment | Shop)}
+        
+        def total_profit(solution: List[Building]) -> float:
+            return sum(profits.get(id(building), 0.0) for building in solution)
+        
+        best, best_profit = None, None
+        candidates = BoundedKnapsack.solve_top_k(
+            self.surface.area, 
+            buildings, 
+            budget, 
+            self.solutions_amount,
+            self.resolution,
+            self.engine
+        )
+        for candidate in candidates:
+            if best is not None and total_profit(candidate) <= best_profit:
+                break
+            result = self._reduce(candidate, profits)
+            if result is not None and (best is None or total_profit(result[0]) > best_profit):
+                best, best_profit = result, total_profit(result[0])
+                
+        if best is None:
+            raise ValueError(s + "Невозможно расположить даже требуемые объекты!")
+        return best
@@ -7,7 +7,9 @@ DEFAULT_NUMBER_MAXIMUM = (10 ** 10) ** 10
 DEFAULT_NUMBER_MINIMUM = -DEFAULT_NUMBER_MAXIMUM
 
 
+from .validation_mode import *
 from .validator import *
 from .list_validator import *
 from .number_validator import *
-from .string_validator import *
\ No newline at end of file
+from .string_validator import *
+from .validation_counter import *
\ No newline at end of file
@@ -28,14 +28,14 @@ class NumberValidator(Validator):
     ) -> Tuple[None | ValueError, str]:
         new_minimum = min(minimum, maximum)
         new_maximum = max(minimum, maximum)
+        if new_minimum <= value <= new_maximum or value != value:
+            return None, str()
         message = f"Недопустимое значение ({_format_number(value)})! "
         if value < new_minimum:
             message += f"Значение должно быть не меньше {_format_number(new_minimum)}!"
-            return ValueError, message
-        if value > new_maximum:
+        else:
             message += f"Значение должно быть не больше {_format_number(new_maximum)}!"
-            return ValueError, message
-        return None, str()
+        return ValueError, message
     
     @classmethod
     def _validate_interval(
@@ -0,0 +1,33 @@
+from collections import Counter
+
+from .validation_mode import _validation_calls
+
+
+__all__ = [
+    "ValidationCounter",
+]
+
+
+class ValidationCounter:
+    
+    # Подсчёт вызовов валидаторов внутри блока with, например на одно
+    # решение рюкзака: calls["NumberValidator"], calls["_validate"] и т. д.
+    
+    def __init__(self) -> None:
+        self.calls = Counter()
+        self._token = None
+        
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+        
+    def __enter__(self) -> "ValidationCounter":
+        self.calls = Counter()
+        self._token = _validation_calls.set(self.calls)
+        return self
+    
+    def __exit__(self, *args) -> None:
+        _validation_calls.reset(self._token)
+        previous = _validation_calls.get()
+        if previous is not None:
+            previous.update(self.calls)
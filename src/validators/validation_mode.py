@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+__all__ = [
+    "validation_disabled",
+    "is_validation_enabled",
+    "count_validation",
+]
+
+
+# Флаг доверенного режима и счётчик вызовов хранятся в contextvars, поэтому
+# отключение проверок или замер в одном потоке или задаче не влияет
+# на остальные (например, на GUI)
+_validation_enabled = ContextVar("validation_enabled", default=True)
+_validation_calls = ContextVar("validation_calls", default=None)
+
+
+def is_validation_enabled() -> bool:
+    return _validation_enabled.get()
+
+
+@contextmanager
+def validation_disabled() -> Iterator[None]:
+    token = _validation_enabled.set(False)
+    try:
+        yield
+    finally:
+        _validation_enabled.reset(token)
+
+
+def count_validation(name: str) -> None:
+    calls = _validation_calls.get()
+    if calls is not None:
+        calls[name] += 1
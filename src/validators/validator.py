@@ -2,6 +2,8 @@ from abc import abstractmethod
 from types import UnionType
 from typing import Type, Union, Tuple, List, get_args
 
+from .validation_mode import is_validation_enabled, count_validation
+
 
 __all__ = [
     "Validator",
@@ -75,21 +77,25 @@ class Validator:
             
         _type = cls.__get_types(_type)
         expected_types = cls.__get_types(expected_types)
+        if cls.__is_type_of_type(_type, expected_types):
+            return None, str()
         message = f"Недопустимый тип {cls.__format_union_types(_type)}! "
         message += f"Ожидался тип {cls.__format_union_types(expected_types)}!"
-        if isinstance(_type, type) and isinstance(expected_types, type) and \
-            _type != expected_types:
-            return TypeError, message
-        if isinstance(_type, type) and isinstance(expected_types, tuple) and \
-            _type not in expected_types:
-            return TypeError, message
-        if isinstance(_type, tuple) and isinstance(expected_types, type) and \
-            (len(_type) != 1 or len(_type) == 1 and _type[0] != expected_types):
-            return TypeError, message
-        if isinstance(_type, tuple) and isinstance(expected_types, tuple) and \
-            not set(_type).issubset(expected_types):
-                return TypeError, message
-        return None, str()
+        return TypeError, message
+    
+    @classmethod
+    def __is_type_of_type(
+        cls, 
+        _type: Type | Tuple[Type], 
+        expected_types: Type | Tuple[Type]
+    ) -> bool:
+        if isinstance(_type, type) and isinstance(expected_types, type):
+            return _type == expected_types
+        if isinstance(_type, type):
+            return _type in expected_types
+        if isinstance(expected_types, type):
+            return len(_type) == 1 and _type[0] == expected_types
+        return set(_type).issubset(expected_types)
     
     @classmethod
     def validate_object(cls, value: object) -> Tuple[None | TypeError, str]:
@@ -112,14 +118,13 @@ class Validator:
         if exception:
             return exception, message
         
+        types = cls.__get_types(expected_type)
+        if isinstance(types, type) and isinstance(value, types) or \
+            isinstance(types, tuple) and type(value) in types:
+            return None, str()
         message = f"Недопустимый тип '{type(value).__name__}'! "
         message += f"Ожидался тип {cls.__format_union_types(expected_type)}!"
-        expected_type = cls.__get_types(expected_type)
-        if isinstance(expected_type, type) and not isinstance(value, expected_type):
-            return TypeError, message
-        if isinstance(expected_type, tuple) and type(value) not in expected_type:
-            return TypeError, message
-        return None, str()
+        return TypeError, message
             
     @classmethod
     def validate_value(
@@ -143,6 +148,9 @@ class Validator:
     
     @classmethod
     def _handle_exception(cls, function, message, *args):
+        if not is_validation_enabled():
+            return
+        count_validation(cls.__name__)
         exception, _message = function(*args)
         if exception:
             raise exception(message + _message)
@@ -7,6 +7,7 @@ from ... import _operate, _type_error, _validation_operation
 from ...constants import OPERATORS
 from ...validators import NUMBER_TYPES
 from ...validators import NumberValidator
+from ...validators import DEFAULT_NUMBER_MINIMUM, DEFAULT_NUMBER_MAXIMUM
 
 
 __all__ = [
@@ -22,6 +23,10 @@ class Real:
     
     DEFAULT_REAL_VALUE = 0
     
+    # Типы, для которых арифметика выполняется без повторной валидации:
+    # результат операции над ними снова int или float
+    FAST_TYPES = (int, float)
+    
     @property
     def class_name(self) -> str:
         return self.__class__.__name__
@@ -42,6 +47,13 @@ class Real:
     def __init__(self, value: NUMBER_TYPES = DEFAULT_REAL_VALUE) -> None:
         self.value = value.value if isinstance(value, Real) else value
         
+    @classmethod
+    def _trusted(cls, value: NUMBER_TYPES) -> "Real":
+        # Конструктор для заведомо допустимых значений: без валидатора
+        real = object.__new__(cls)
+        real._value = value
+        return real
+        
     # ------------------- Output ---------------------------
         
     def __format_value(self) -> str:
@@ -75,10 +87,10 @@ class Real:
     def __pos__(self) -> "Real":
         return self
     def __neg__(self) -> "Real":
-        return Real(-self.value)
+        return Real._trusted(-self.value)
     
     def __abs__(self) -> "Real":
-        return Real(abs(self.value))
+        return Real._trusted(abs(self.value))
     
     def __inv__(self) -> "Real":
         return ~self
@@ -87,11 +99,11 @@ class Real:
         raise TypeError(_error(self, message))
     
     def __floor__(self) -> "Real":
-        return Real(math.floor(self.value))
+        return Real._trusted(math.floor(self.value))
     def __ceil__(self) -> "Real":
-        return Real(math.ceil(self.value))
+        return Real._trusted(math.ceil(self.value))
     def __trunc__(self) -> "Real":
-        return Real(math.trunc(self.value))
+        return Real._trusted(math.trunc(self.value))
     
     def __int__(self) -> int:
         return int(self.value)
@@ -104,12 +116,29 @@ class Real:
     # ------------------- Binary operators ---------------------------
     
     def __round__(self, n: int = 0) -> "Real":
-        return Real(round(self.value, n))
+        return Real._trusted(round(self.value, n))
+    
+    # ------------------- Fast path ---------------------------
+    
+    @staticmethod
+    def _get_fast_value(obj: object) -> NUMBER_TYPES | None:
+        if type(obj) is Real:
+            obj = obj._value
+        return obj if type(obj) in Real.FAST_TYPES else None
+    
+    @staticmethod
+    def _is_fast_result(value: object) -> bool:
+        return type(value) in Real.FAST_TYPES and \
+            DEFAULT_NUMBER_MINIMUM <= value <= DEFAULT_NUMBER_MAXIMUM
     
     # ------------------- Comparison operators ---------------------------
     
     @staticmethod
     def __compare(right: object, left: object, operator: operator) -> bool:
+        right_value = Real._get_fast_value(right)
+        left_value = Real._get_fast_value(left)
+        if right_value is not None and left_value is not None:
+            return operator(right_value, left_value)
         return _validation_operation(right, left, operator, Real)
     
     def __eq__(self, other: object) -> bool:
@@ -131,6 +160,11 @@ class Real:
     
     @staticmethod
     def __math(right: object, left: object, operator: operator) -> "Real":
+        right_value = Real._get_fast_value(right)
+        left_value = Real._get_fast_value(left)
+        if right_value is not None and left_value is not None:
+            value = operator(right_value, left_value)
+            return Real._trusted(value) if Real._is_fast_result(value) else Real(value)
         return Real(_validation_operation(right, left, operator, Real))
     
     def __add__(self, other: object) -> "Real":
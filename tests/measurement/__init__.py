@@ -0,0 +1,2 @@
+from .length_test import *
+from .money_test import *
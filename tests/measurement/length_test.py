@@ -0,0 +1,77 @@
+import allure
+import typing
+import unittest
+import operator
+
+from fractions import Fraction
+
+from .. import allure_details, random_shuffle
+
+from src.measurement.length import Length, Meter, KiloMeter, CentiMeter, MilliMeter, MeterConverter
+
+
+__all__ = [
+    "LengthTestCase",
+]
+
+
+@allure.suite("LengthTest")
+class LengthTestCase(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.types = [Meter, KiloMeter, CentiMeter, MilliMeter]
+        self.values = [0, 1, 2.5, 7, 1000]
+        self.operations = [operator.add, operator.mul, operator.truediv, operator.eq, operator.lt, operator.ge]
+        
+    @staticmethod
+    def __convert(length: Length) -> Meter:
+        return MeterConverter.convert(length, Meter)
+        
+    def __pairs(self) -> typing.List[typing.Tuple[Length, Length]]:
+        lengths = [type_(value) for type_ in self.types for value in self.values]
+        return [(right, left) for right in lengths for left in lengths if left.value != 0]
+    
+    @allure.sub_suite("Canonical meters")
+    def test_meters(self) -> None:
+        for type_ in random_shuffle(self.types):
+            for value in self.values:
+                length = type_(value)
+                self.assertEqual(length._meters, self.__convert(length).value)
+                allure_details(f"{length!r} is {length._meters} m")
+        self.assertIsNone(Meter(Fraction(1, 3))._meters)
+        
+    @allure.sub_suite("Cross-unit operations")
+    def test_cross_unit_operations(self) -> None:
+        for right, left in self.__pairs():
+            for operation in self.operations:
+                result = operation(right, left)
+                expected = operation(self.__convert(right), self.__convert(left))
+                self.assertEqual(type(result), type(expected))
+                self.assertEqual(repr(result), repr(expected))
+        allure_details(f"{len(self.__pairs())} pairs matched the converted operands")
+                
+    @allure.sub_suite("Cross-unit operations")
+    def test_cross_unit_output(self) -> None:
+        self.assertEqual(repr(KiloMeter(1) + Meter(500)), "Meter (value: 1 500 метров)")
+        self.assertEqual(str(CentiMeter(50) + Meter(1)), "1.5 метра")
+        self.assertEqual(repr(KiloMeter(1) + 5), "KiloMeter (value: 6 километров)")
+        self.assertEqual(repr(Length(3) + KiloMeter(1)), "Meter (value: 4 000 метров)")
+        
+    @allure.sub_suite("Cross-unit operations")
+    def test_cross_unit_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            Meter(1) - KiloMeter(1)
+        result = Meter(Fraction(1, 2)) + CentiMeter(50)
+        self.assertEqual(result, Meter(1))
+        allure_details(repr(result))
+        
+    @allure.sub_suite("Registry")
+    def test_registry(self) -> None:
+        meter_types = [Meter] + Meter.__subclasses__()
+        self.assertEqual(list(MeterConverter.get_meter_types()), meter_types)
+        self.assertEqual(list(Length.get_types()), [Length] + meter_types)
+        self.assertIs(MeterConverter.get_meter_types(), MeterConverter.get_meter_types())
+        for length_type in Length.get_types():
+            self.assertIs(Length.find_type(length_type.FULL_FORM), length_type)
+        self.assertIsNone(Length.find_type("ярд"))
+        allure_details(", ".join(length_type.FULL_FORM for length_type in Length.get_types()))
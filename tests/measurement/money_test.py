@@ -0,0 +1,27 @@
+import allure
+import unittest
+
+from .. import allure_details
+
+from src.measurement.money import Money, Ruble, Dollar, MoneyConverter
+
+
+__all__ = [
+    "MoneyTestCase",
+]
+
+
+@allure.suite("MoneyTest")
+class MoneyTestCase(unittest.TestCase):
+    
+    @allure.sub_suite("Registry")
+    def test_registry(self) -> None:
+        self.assertEqual(list(MoneyConverter.get_money_types()), Money.__subclasses__())
+        self.assertEqual(list(Money.get_types()), [Money] + Money.__subclasses__())
+        self.assertEqual(Ruble.get_types(), (Ruble,))
+        for money_type in Money.get_types():
+            self.assertIs(Money.find_type(money_type.FULL_FORM), money_type)
+            self.assertIs(Money.find_international_type(money_type.INTERNATIONAL_FORM), money_type)
+        self.assertIs(Money.find_international_type("USD"), Dollar)
+        self.assertIsNone(Money.find_type("франк"))
+        allure_details(", ".join(money_type.INTERNATIONAL_FORM for money_type in Money.get_types()))
@@ -0,0 +1,232 @@
+import math
+import random
+import allure
+import typing
+import unittest
+import itertools
+
+from .. import allure_details
+
+from src.models.knapsack import BoundedKnapsack, BranchAndBoundKnapsack, IncrementalKnapsack, KnapsackSolution
+
+
+__all__ = [
+    "BoundedKnapsackTestCase",
+]
+
+
+@allure.suite("BoundedKnapsackTest")
+class BoundedKnapsackTestCase(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        self.random = random.Random(2024)
+        self.instances = [self.__generate_instance() for _ in range(50)]
+        
+    def __generate_instance(self) -> typing.Tuple[typing.List, typing.List, typing.List, int]:
+        n = self.random.randint(1, 4)
+        weights = [self.random.randint(1, 12) for _ in range(n)]
+        profits = [float(self.random.randint(1, 100)) for _ in range(n)]
+        amounts = [self.random.randint(0, 5) for _ in range(n)]
+        return weights, profits, amounts, self.random.randint(0, 40)
+    
+    @staticmethod
+    def __brute_force(weights, profits, amounts, W) -> float:
+        best = 0.0
+        for counts in itertools.product(*(range(amount + 1) for amount in amounts)):
+            if sum(k * weight for k, weight in zip(counts, weights)) <= W:
+                best = max(best, sum(k * profit for k, profit in zip(counts, profits)))
+        return best
+    
+    def __check_counts(self, counts, weights, profits, amounts, W) -> None:
+        self.assertTrue(all(0 <= k <= amount for k, amount in zip(counts, amounts)))
+        self.assertLessEqual(sum(k * weight for k, weight in zip(counts, weights)), W)
+        profit = sum(k * profit for k, profit in zip(counts, profits))
+        self.assertEqual(profit, self.__brute_force(weights, profits, amounts, W))
+        
+    @allure.sub_suite("Engines")
+    def test_engines_are_optimal(self) -> None:
+        pairs = [(engine, strategy) for engine in BoundedKnapsack.ENGINES for strategy in BoundedKnapsack.STRATEGIES]
+        for engine, strategy in pairs:
+            for weights, profits, amounts, W in self.instances:
+                counts = BoundedKnapsack._solve_counts(weights, profits, amounts, W, engine, strategy)
+                self.__check_counts(counts, weights, profits, amounts, W)
+            allure_details(f"Engine '{engine}' with strategy '{strategy}' matched brute force on {len(self.instances)} instances")
+            
+    @allure.sub_suite("Engines")
+    def test_engines_agree(self) -> None:
+        for strategy in BoundedKnapsack.STRATEGIES:
+            for weights, profits, amounts, W in self.instances:
+                args = (weights, profits, amounts, W)
+                python = BoundedKnapsack._solve_counts(*args, BoundedKnapsack.PYTHON_ENGINE, strategy)
+                numpy = BoundedKnapsack._solve_counts(*args, BoundedKnapsack.NUMPY_ENGINE, strategy)
+                self.assertEqual(python, numpy)
+                
+    @allure.sub_suite("Engines")
+    def test_strategies_agree_on_many_copies(self) -> None:
+        for _ in range(20):
+            n = self.random.randint(1, 4)
+            weights = [self.random.randint(1, 9) for _ in range(n)]
+            profits = [float(self.random.randint(1, 100)) for _ in range(n)]
+            amounts = [self.random.randint(0, 40) for _ in range(n)]
+            W = self.random.randint(0, 200)
+            
+            args = (weights, profits, amounts, W)
+            reference = BoundedKnapsack._solve_counts(*args, BoundedKnapsack.PYTHON_ENGINE, BoundedKnapsack.BOUNDED_STRATEGY)
+            expected = sum(k * profit for k, profit in zip(reference, profits))
+            for engine in BoundedKnapsack.ENGINES:
+                for strategy in BoundedKnapsack.STRATEGIES:
+                    counts = BoundedKnapsack._solve_counts(*args, engine, strategy)
+                    self.assertTrue(all(0 <= k <= amount for k, amount in zip(counts, amounts)))
+                    self.assertLessEqual(sum(k * weight for k, weight in zip(counts, weights)), W)
+                    self.assertEqual(sum(k * profit for k, profit in zip(counts, profits)), expected)
+                    
+    @allure.sub_suite("K best solutions")
+    def test_top_k(self) -> None:
+        for K in [1, 3, 5]:
+            for weights, profits, amounts, W in self.instances:
+                result = BoundedKnapsack._solve_top_k_counts(weights, profits, amounts, W, K)
+                numpy_result = BoundedKnapsack._solve_top_k_counts(
+                    weights, profits, amounts, W, K, BoundedKnapsack.NUMPY_ENGINE
+                )
+                
+                options = [option for option in itertools.product(*(range(amount + 1) for amount in amounts)) \
+                    if sum(k * weight for k, weight in zip(option, weights)) <= W]
+                expected = sorted((sum(k * profit for k, profit in zip(option, profits)) for option in options), reverse=True)[:K]
+                
+                self.assertEqual([profit for profit, _ in result], expected)
+                self.assertEqual([profit for profit, _ in numpy_result], expected)
+                self.assertEqual(len({tuple(counts) for _, counts in numpy_result}), len(numpy_result))
+                self.assertEqual(len({tuple(counts) for _, counts in result}), len(result))
+                for profit, counts in result:
+                    self.assertLessEqual(sum(k * weight for k, weight in zip(counts, weights)), W)
+                    self.assertTrue(all(0 <= k <= amount for k, amount in zip(counts, amounts)))
+                    self.assertEqual(sum(k * p for k, p in zip(counts, profits)), profit)
+            allure_details(f"{K} best solutions matched brute force on {len(self.instances)} instances")
+        
+    @allure.sub_suite("Branch and bound")
+    def test_branch_and_bound_is_optimal(self) -> None:
+        for weights, profits, amounts, W in self.instances:
+            counts = BranchAndBoundKnapsack._solve_counts(weights, profits, amounts, W)
+            self.__check_counts(counts, weights, profits, amounts, W)
+        allure_details(f"Branch and bound matched brute force on {len(self.instances)} instances")
+        
+    @allure.sub_suite("Branch and bound")
+    def test_branch_and_bound_huge_capacity(self) -> None:
+        weights = [4000.0, 3000.0, 4200.0, 3500.5, 2750.25]
+        profits = [65_000_000.0, 41_000_000.0, 70_000_000.0, 52_000_000.0, 30_000_000.0]
+        amounts = [30, 1, 25, 40, 1]
+        capacity = 250_000.0
+        counts = BranchAndBoundKnapsack._solve_counts(weights, profits, amounts, capacity)
+        
+        self.assertLessEqual(sum(k * weight for k, weight in zip(counts, weights)), capacity)
+        args = ([math.ceil(weight) for weight in weights], profits, amounts, int(capacity))
+        expected = BoundedKnapsack._solve_counts(*args, BoundedKnapsack.NUMPY_ENGINE, BoundedKnapsack.LEAN_STRATEGY)
+        self.assertGreaterEqual(
+            sum(k * profit for k, profit in zip(counts, profits)),
+            sum(k * profit for k, profit in zip(expected, profits))
+        )
+        allure_details(f"Branch and bound on {capacity} m² resulted in {counts}")
+        
+    @allure.sub_suite("Two-dimensional knapsack")
+    def test_two_dimensional_is_optimal(self) -> None:
+        for weights, profits, amounts, W in self.instances:
+            costs = [self.random.randint(1, 10) for _ in weights]
+            B = self.random.randint(0, 30)
+            counts = BoundedKnapsack._solve_two_dimensional_counts(weights, costs, profits, amounts, W, B)
+            
+            self.assertTrue(all(0 <= k <= amount for k, amount in zip(counts, amounts)))
+            self.assertLessEqual(sum(k * weight for k, weight in zip(counts, weights)), W)
+            self.assertLessEqual(sum(k * cost for k, cost in zip(counts, costs)), B)
+            
+            best = 0.0
+            for option in itertools.product(*(range(amount + 1) for amount in amounts)):
+                if sum(k * weight for k, weight in zip(option, weights)) <= W and \
+                    sum(k * cost for k, cost in zip(option, costs)) <= B:
+                    best = max(best, sum(k * profit for k, profit in zip(option, profits)))
+            self.assertEqual(sum(k * profit for k, profit in zip(counts, profits)), best)
+        allure_details(f"Two-dimensional knapsack matched brute force on {len(self.instances)} instances")
+                    
+    @allure.sub_suite("Incremental knapsack")
+    def test_incremental_is_optimal(self) -> None:
+        state = IncrementalKnapsack()
+        weights, profits, amounts, W = self.__generate_instance()
+        keys = list(range(len(weights)))
+        for _ in range(30):
+            counts = BoundedKnapsack._solve_incremental_counts(state, keys, weights, profits, amounts, W, 1)
+            self.__check_counts(counts, weights, profits, amounts, W)
+            
+            i = self.random.randrange(len(weights))
+            weights[i] = self.random.randint(1, 12)
+            profits[i] = float(self.random.randint(1, 100))
+            W = self.random.randint(0, 40)
+        allure_details(f"Incremental knapsack matched brute force after 30 edits of {len(weights)} items")
+        
+    @allure.sub_suite("Incremental knapsack")
+    def test_incremental_reuses_rows(self) -> None:
+        state = IncrementalKnapsack()
+        weights, profits, amounts = [3, 5, 7, 2], [10.0, 20.0, 30.0, 5.0], [2, 2, 2, 2]
+        keys = ["a", "b", "c", "d"]
+        BoundedKnapsack._solve_incremental_counts(state, keys, weights, profits, amounts, 20, 1)
+        self.assertEqual(state.computed_rows, 4)
+        
+        profits[1] = 25.0
+        counts = BoundedKnapsack._solve_incremental_counts(state, keys, weights, profits, amounts, 20, 1)
+        self.__check_counts(counts, weights, profits, amounts, 20)
+        self.assertEqual((state.reused_rows, state.computed_rows), (1, 3))
+        self.assertEqual(state.keys, ["a", "c", "d", "b"])
+        
+        profits[1] = 15.0
+        counts = BoundedKnapsack._solve_incremental_counts(state, keys, weights, profits, amounts, 15, 1)
+        self.__check_counts(counts, weights, profits, amounts, 15)
+        self.assertEqual((state.reused_rows, state.computed_rows), (3, 1))
+        
+        counts = BoundedKnapsack._solve_incremental_counts(state, keys, weights, profits, amounts, 30, 1)
+        self.__check_counts(counts, weights, profits, amounts, 30)
+        self.assertEqual(state.reused_rows, 0)
+        allure_details(f"Incremental knapsack reordered items to {state.keys}")
+                    
+    @allure.sub_suite("Binary splitting")
+    def test_binary_decomposition(self) -> None:
+        for amounts in [[0], [1], [7], [8], [1, 13, 100]]:
+            pieces = BoundedKnapsack._convert_to_binary_knapsack(amounts)
+            for i, amount in enumerate(amounts):
+                copies = [piece for index, piece in pieces if index == i]
+                self.assertEqual(sum(copies), amount)
+                self.assertLessEqual(len(copies), amount.bit_length())
+                subset_sums = {sum(subset) for r in range(len(copies) + 1) for subset in itertools.combinations(copies, r)}
+                self.assertEqual(subset_sums, set(range(amount + 1)))
+            allure_details(f"Binary splitting of {amounts} resulted in {pieces}")
+            
+    @allure.sub_suite("Resolution")
+    def test_auto_resolution(self) -> None:
+        footprints = [4000.0, 3000.0, 4200.0]
+        quantum = BoundedKnapsack._get_quantum(footprints, BoundedKnapsack.AUTO_RESOLUTION)
+        self.assertEqual(quantum, 200)
+        self.assertEqual(BoundedKnapsack._get_weights(footprints, quantum), [20, 15, 21])
+        self.assertEqual(BoundedKnapsack._get_quantum(footprints, 300), 300)
+        self.assertEqual(BoundedKnapsack._get_weights(footprints, 300), [14, 10, 14])
+        self.assertEqual(BoundedKnapsack._get_quantum([4000.5, 3000.0], BoundedKnapsack.AUTO_RESOLUTION), 1)
+        allure_details(f"Automatic resolution of {footprints} resulted in {quantum} m²")
+        
+    @allure.sub_suite("Resolution")
+    def test_solution_table_size(self) -> None:
+        solution = KnapsackSolution([], 200, (5, 91))
+        self.assertIsInstance(solution, list)
+        self.assertEqual(solution.quantum, 200)
+        self.assertEqual(solution.cells, 455)
+        self.assertEqual(KnapsackSolution().cells, 0)
+        allure_details(solution.print_table_size())
+        
+    @allure.sub_suite("Validation")
+    def test_unknown_resolution(self) -> None:
+        for resolution in [0, -100, "manual", 1.5]:
+            with self.assertRaises((ValueError, TypeError)) as context:
+                BoundedKnapsack._validate_resolution(resolution, "\n\tBoundedKnapsack: ")
+            allure_details(str(context.exception))
+        
+    @allure.sub_suite("Validation")
+    def test_unknown_choice(self) -> None:
+        for value in ["cuda", str(), 1]:
+            with self.assertRaises((ValueError, TypeError)) as context:
+                BoundedKnapsack._validate_choice(value, BoundedKnapsack.ENGINES, "\n\tBoundedKnapsack: ")
+            allure_details(str(context.exception))
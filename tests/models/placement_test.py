@@ -0,0 +1,589 @@
+import os
+import pickle
+import tempfile
+import threading
+import numpy as np
+import random
+import allure
+import typing
+import unittest
+
+from .. import allure_details
+
+from src.measurement.length import Meter
+from src.models.buildings import School, Kindergarten
+from src.models.placement import Binpacker, Block, ExactPacker, GridPacker, PackingCache, GuillotineTree, MaxRectsPacker, PackingBounds, SkylinePacker, StagedPacker
+
+
+__all__ = [
+    "BinpackerTestCase",
+    "MaxRectsPackerTestCase",
+    "SkylinePackerTestCase",
+    "PackingBoundsTestCase",
+    "ExactPackerTestCase",
+    "PackingCacheTestCase",
+    "GridPackerTestCase",
+]
+
+
+class PackingTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.random = random.Random(2024)
+
+    def _generate_blocks(self, amount: int, size: int) -> typing.List[Block]:
+        return [
+            Block(str(i), 0, self.random.randint(1, size), self.random.randint(1, size)) \
+                for i in range(amount)
+        ]
+
+    def _check_placements(self, packer: Binpacker, blocks: typing.List[Block]) -> None:
+        self.assertEqual(len(packer.placements), len(blocks))
+        for i, (_, _, width, height, x, y) in enumerate(packer.placements):
+            self.assertGreaterEqual(min(x, y), 0)
+            self.assertLessEqual(x + width, packer.root["width"])
+            self.assertLessEqual(y + height, packer.root["height"])
+            for _, _, other_width, other_height, other_x, other_y in packer.placements[i + 1:]:
+                self.assertTrue(
+                    x + width <= other_x or other_x + other_width <= x or \
+                        y + height <= other_y or other_y + other_height <= y
+                )
+
+
+@allure.suite("BinpackerTest")
+class BinpackerTestCase(PackingTestCase):
+
+    @allure.sub_suite("Guillotine tree")
+    def test_split_and_unsplit(self) -> None:
+        tree = GuillotineTree(10, 8)
+        tree.split(0, 4, 3)
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(tree.find(6, 3), tree.right[0])
+        self.assertEqual(tree.find(10, 5), tree.right[0] - 1)
+        self.assertEqual(tree.find(10, 6), GuillotineTree.NO_NODE)
+
+        tree.split(tree.right[0], 6, 3)
+        self.assertEqual(tree.depth, 2)
+        self.assertEqual(tree.unsplit(), 2)
+        self.assertEqual(tree.unsplit(), 0)
+        self.assertEqual((len(tree), tree.depth, tree.used[0]), (1, 0, 0))
+        allure_details(f"Guillotine tree returned to {len(tree)} node after unsplit")
+
+    @allure.sub_suite("Guillotine tree")
+    def test_from_dict(self) -> None:
+        root = {"width": 10, "height": 8, "x": 0, "y": 0, "used": True}
+        root["down"] = {"x": 0, "y": 3, "width": 10, "height": 5, "used": False}
+        root["right"] = {"x": 4, "y": 0, "width": 6, "height": 3, "used": False}
+        tree = GuillotineTree.from_dict(root)
+        self.assertEqual(len(tree), 3)
+        self.assertEqual((tree.x[tree.right[0]], tree.width[tree.right[0]]), (4, 6))
+        self.assertEqual((tree.y[tree.right[0] - 1], tree.height[tree.right[0] - 1]), (3, 5))
+
+    @allure.sub_suite("Fittable")
+    def test_fittable_is_valid(self) -> None:
+        for _ in range(200):
+            blocks = self._generate_blocks(self.random.randint(1, 8), 40)
+            for rotatable in (False, True):
+                packer = Binpacker(self.random.randint(20, 100), self.random.randint(20, 100))
+                if packer.fittable(blocks, rotatable):
+                    self._check_placements(packer, blocks)
+                else:
+                    self.assertEqual(packer.placements, list())
+
+    @allure.sub_suite("Fittable")
+    def test_fittable_rotates(self) -> None:
+        blocks = [
+            Block("A", 0, 10, 4),
+            Block("B", 0, 6, 10),
+        ]
+        self.assertFalse(Binpacker(10, 10).fittable(blocks))
+        packer = Binpacker(10, 10)
+        self.assertTrue(packer.fittable(blocks, rotatable=True))
+        self._check_placements(packer, blocks)
+        allure_details(f"Rotated placements: {packer.placements}")
+
+    @allure.sub_suite("Fittable")
+    def test_fittable_many_blocks(self) -> None:
+        blocks = [Block("A", 0, 2, 2) for _ in range(900)]
+        packer = Binpacker(60, 60)
+        self.assertTrue(packer.fittable(blocks))
+        self.assertEqual(len(packer.placements), 900)
+        self.assertFalse(Binpacker(60, 60).fittable(blocks + blocks[:1]))
+        allure_details(f"Packed {len(blocks)} blocks without recursion")
+
+    @allure.sub_suite("Rotation search")
+    def test_rotation_states(self) -> None:
+        packer = Binpacker(10, 10)
+        groups = [[0, 1], [2]]
+        self.assertEqual(list(packer._rotation_states(groups, 0)), [[0, 0]])
+        self.assertEqual(list(packer._rotation_states(groups, 1)), [[1, 0], [0, 1]])
+        states = [state for rotations in range(4) for state in packer._rotation_states(groups, rotations)]
+        self.assertEqual(len(states), 6)
+        self.assertEqual(len(set(map(tuple, states))), 6)
+        allure_details(f"Rotation states: {states}")
+
+    @allure.sub_suite("Rotation search")
+    def test_rotation_groups(self) -> None:
+        blocks = [
+            Block("A", 0, 2, 4),
+            Block("B", 0, 3, 3),
+            Block("A", 0, 4, 2),
+            Block("C", 0, 5, 6),
+        ]
+        self.assertEqual(Binpacker(10, 10)._rotation_groups(blocks), [[3], [0, 2]])
+
+    @allure.sub_suite("Rotation search")
+    def test_rotation_symmetry_is_heuristic(self) -> None:
+        # Поворачивается только первая копия одинаковых блоков, а
+        # упаковка есть лишь при повороте второй
+        blocks = [Block("A", 0, 3, 2), Block("A", 0, 3, 2), Block("B", 0, 3, 3)]
+        packer = Binpacker(5, 5, node_limit=None)
+        self.assertFalse(packer._search([blocks]))
+        self.assertEqual(packer.status, Binpacker.NOT_FITTED)
+        self.assertTrue(Binpacker(5, 5).fittable([blocks[0], blocks[1].rotated(), blocks[2]]))
+
+    @allure.sub_suite("Rotation search")
+    def test_identical_blocks_are_pruned(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(20)]
+        packer = Binpacker(290, 290)
+        self.assertFalse(packer.fit_blocks(buildings))
+        self.assertEqual(packer.status, Binpacker.NOT_FITTED)
+        self.assertEqual(packer.nodes, 21)
+        
+        packer = Binpacker(300, 300)
+        self.assertTrue(packer.fit_blocks(buildings))
+        self.assertEqual(packer.status, Binpacker.FITTED)
+        allure_details(f"{len(buildings)} identical blocks fitted after {packer.nodes} attempts")
+
+    @allure.sub_suite("Rotation search")
+    def test_search_budget(self) -> None:
+        buildings = [School(length=Meter(40 + i), width=Meter(70)) for i in range(10)]
+        buildings += [Kindergarten(length=Meter(50), width=Meter(40 + i)) for i in range(10)]
+        packer = Binpacker(290, 290, node_limit=50)
+        self.assertFalse(packer.fit_blocks(buildings))
+        self.assertEqual((packer.status, packer.nodes), (Binpacker.UNKNOWN, 50))
+        
+        packer = Binpacker(290, 290, node_limit=None, time_limit=0.0)
+        self.assertFalse(packer.fit_blocks(buildings))
+        self.assertEqual((packer.status, packer.nodes), (Binpacker.UNKNOWN, 0))
+        allure_details(f"Search stopped with status '{packer.status}'")
+
+    @allure.sub_suite("Parallel packing")
+    def test_parallel_packing(self) -> None:
+        buildings = [School(length=Meter(40 + i), width=Meter(70)) for i in range(6)]
+        buildings += [Kindergarten(length=Meter(50), width=Meter(40 + i)) for i in range(6)]
+        packer = Binpacker(300, 300)
+        self.assertTrue(packer.fit_blocks_parallel(buildings, max_workers=2))
+        self.assertEqual(packer.status, Binpacker.FITTED)
+        self._check_placements(packer, buildings)
+        
+        packer = Binpacker(210, 210, node_limit=100)
+        self.assertFalse(packer.fit_blocks_parallel(buildings, max_workers=2))
+        self.assertEqual(packer.status, Binpacker.UNKNOWN)
+        self.assertEqual(packer.nodes % 100, 0)
+        allure_details(f"Parallel packing made {packer.nodes} attempts")
+
+    @allure.sub_suite("Parallel packing")
+    def test_parallel_executor_is_reused(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(4)]
+        self.assertTrue(Binpacker(200, 200).fit_blocks_parallel(buildings, max_workers=2))
+        executor = Binpacker._executor
+        self.assertTrue(Binpacker(200, 200).fit_blocks_parallel(buildings, max_workers=2))
+        self.assertIs(Binpacker._executor, executor)
+        self.assertTrue(Binpacker._executor_event.is_set())
+        
+        Binpacker.shutdown_executor()
+        self.assertIsNone(Binpacker._executor)
+
+    @allure.sub_suite("Parallel packing")
+    def test_parallel_packing_for_every_packer(self) -> None:
+        packer_types = [Binpacker, MaxRectsPacker, SkylinePacker, StagedPacker, ExactPacker, GridPacker]
+        schools = [School(length=Meter(40), width=Meter(70)) for _ in range(2)]
+        kindergartens = [Kindergarten(length=Meter(50), width=Meter(40)) for _ in range(2)]
+        instances = [(200, 200, schools * 2), (110, 130, schools + kindergartens), (90, 90, schools)]
+        for packer_type in packer_types:
+            for width, height, buildings in instances:
+                sequential = packer_type(width, height)
+                packer = packer_type(width, height)
+                fitted = packer.fit_blocks_parallel(buildings, max_workers=2)
+                self.assertEqual(fitted, sequential.fit_blocks(buildings), packer_type.__name__)
+                self.assertEqual(packer.status, sequential.status, packer_type.__name__)
+                if fitted:
+                    self._check_placements(packer, buildings)
+        allure_details(f"Parallel packing ran for {', '.join(packer_type.__name__ for packer_type in packer_types)}")
+
+    @allure.sub_suite("Parallel packing")
+    def test_parallel_packing_keeps_grid_mask(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70))]
+        packer = GridPacker(100, 100)
+        packer.add_cutout(0, 40, 100, 20)
+        self.assertTrue(Binpacker(100, 100).fit_blocks_parallel(buildings, max_workers=2))
+        self.assertFalse(packer.fit_blocks_parallel(buildings, max_workers=2))
+
+    @allure.sub_suite("Parallel packing")
+    def test_stop_flag(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(4)]
+        event = threading.Event()
+        event.set()
+        Binpacker._stop_event = event
+        try:
+            packer = Binpacker(200, 200, node_limit=None)
+            self.assertFalse(packer.fit_blocks(buildings))
+            self.assertEqual((packer.status, packer.nodes), (Binpacker.UNKNOWN, 0))
+        finally:
+            Binpacker._stop_event = None
+
+    @allure.sub_suite("Parallel packing")
+    def test_compact_block(self) -> None:
+        block = Block("A", 5, 20, 30)
+        self.assertEqual(block.rotated(), Block("A", 5, 30, 20))
+        self.assertEqual((block.area, block.kind), (600, ("A", 5, 20, 30)))
+        self.assertEqual(pickle.loads(pickle.dumps(block)), block)
+        status, nodes, placements = Binpacker._fit_order(40, 40, [block, block], None, None)
+        self.assertEqual((status, nodes), (Binpacker.FITTED, 1))
+        self.assertEqual(placements, [("A", 5, 20, 30, 0, 0), ("A", 5, 20, 30, 20, 0)])
+
+
+@allure.suite("MaxRectsPackerTest")
+class MaxRectsPackerTestCase(PackingTestCase):
+
+    @allure.sub_suite("Heuristics")
+    def test_heuristics_are_valid(self) -> None:
+        for heuristic in MaxRectsPacker.HEURISTICS:
+            packed = 0
+            for _ in range(100):
+                blocks = self._generate_blocks(self.random.randint(1, 12), 40)
+                packer = MaxRectsPacker(self.random.randint(20, 100), self.random.randint(20, 100))
+                if packer.fittable(blocks, True, heuristic):
+                    self._check_placements(packer, blocks)
+                    packed += 1
+                else:
+                    self.assertEqual(packer.placements, list())
+            allure_details(f"Heuristic '{heuristic}' packed {packed} of 100 instances")
+
+    @allure.sub_suite("Heuristics")
+    def test_packs_what_guillotine_rejects(self) -> None:
+        blocks = [
+            Block("A", 0, 2, 1),
+            Block("B", 0, 4, 3),
+            Block("C", 0, 5, 5),
+            Block("D", 0, 5, 3),
+            Block("E", 0, 1, 3),
+        ]
+        self.assertFalse(Binpacker(8, 8).fittable(blocks, rotatable=True))
+        packer = MaxRectsPacker(8, 8)
+        self.assertTrue(any(packer.fittable(blocks, True, heuristic) for heuristic in MaxRectsPacker.HEURISTICS))
+        self._check_placements(packer, blocks)
+        allure_details(f"MaxRects placements: {packer.placements}")
+
+    @allure.sub_suite("Heuristics")
+    def test_perfect_fit(self) -> None:
+        blocks = [Block(str(i), 0, 3, 5) for i in range(15)]
+        for heuristic in [MaxRectsPacker.BOTTOM_LEFT, MaxRectsPacker.CONTACT_POINT]:
+            packer = MaxRectsPacker(15, 15)
+            self.assertTrue(packer.fittable(blocks, True, heuristic))
+            self._check_placements(packer, blocks)
+
+    @allure.sub_suite("Validation")
+    def test_unknown_heuristic(self) -> None:
+        with self.assertRaises(ValueError) as context:
+            MaxRectsPacker(10, 10, "random")
+        allure_details(str(context.exception))
+
+
+@allure.suite("SkylinePackerTest")
+class SkylinePackerTestCase(PackingTestCase):
+
+    @allure.sub_suite("Skyline")
+    def test_skyline_is_valid(self) -> None:
+        packed = 0
+        for _ in range(200):
+            blocks = self._generate_blocks(self.random.randint(1, 12), 40)
+            packer = SkylinePacker(self.random.randint(20, 100), self.random.randint(20, 100))
+            for rotatable in (False, True):
+                if packer.fittable(blocks, rotatable):
+                    self._check_placements(packer, blocks)
+                    packed += 1
+                else:
+                    self.assertEqual(packer.placements, list())
+        allure_details(f"Skyline packed {packed} of 400 instances")
+
+    @allure.sub_suite("Skyline")
+    def test_skyline_merges_segments(self) -> None:
+        packer = SkylinePacker(10, 10)
+        blocks = [Block(str(i), 0, 5, 2) for i in range(10)]
+        self.assertTrue(packer.fittable(blocks))
+        self.assertEqual(packer.skyline, [[0, 10, 10]])
+        self.assertFalse(packer.fittable(blocks + blocks[:1]))
+        allure_details(f"Skyline placements: {packer.placements}")
+
+    @allure.sub_suite("Staged")
+    def test_staged_precheck(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(20)]
+        packer = StagedPacker(100, 100)
+        self.assertFalse(packer.fit_blocks(buildings))
+        self.assertEqual(packer.stage, StagedPacker.PRECHECK_STAGE)
+        self.assertEqual(packer.nodes, 0)
+
+    @allure.sub_suite("Staged")
+    def test_staged_skyline(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)), Kindergarten(length=Meter(50), width=Meter(40))]
+        packer = StagedPacker(100, 130)
+        self.assertTrue(packer.fit_blocks(buildings))
+        self.assertEqual(packer.stage, StagedPacker.SKYLINE_STAGE)
+        self.assertEqual(packer.nodes, 0)
+        self._check_placements(packer, buildings)
+
+    @allure.sub_suite("Staged")
+    def test_staged_exhaustive(self) -> None:
+        # Жадный skyline не находит раскладку, её находит полный перебор
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(2)]
+        buildings += [Kindergarten(length=Meter(50), width=Meter(40))]
+        self.assertFalse(SkylinePacker(100, 130).fit_blocks(buildings))
+        packer = StagedPacker(100, 130)
+        self.assertTrue(packer.fit_blocks(buildings))
+        self.assertEqual(packer.stage, StagedPacker.EXHAUSTIVE_STAGE)
+        self.assertGreater(packer.nodes, 0)
+        self._check_placements(packer, buildings)
+        allure_details(f"Exhaustive stage made {packer.nodes} attempts")
+
+
+@allure.suite("PackingBoundsTest")
+class PackingBoundsTestCase(PackingTestCase):
+
+    @allure.sub_suite("Bounds")
+    def test_bounds(self) -> None:
+        self.assertEqual(PackingBounds.check(10, 10, [(5, 5)] * 4), None)
+        self.assertEqual(PackingBounds.check(10, 10, [(5, 5)] * 5), PackingBounds.AREA_REASON)
+        self.assertEqual(PackingBounds.check(10, 20, [(15, 8)]), None)
+        self.assertEqual(PackingBounds.check(10, 20, [(15, 11)]), PackingBounds.DIMENSION_REASON)
+        self.assertEqual(PackingBounds.check(10, 10, [(7, 6)] * 2), PackingBounds.STRIP_REASON)
+        self.assertEqual(PackingBounds.check(10, 10, [(6, 7), (7, 4)]), None)
+        self.assertEqual(PackingBounds.check(10, 10, [(4, 7), (10, 4)]), None)
+
+    @allure.sub_suite("Bounds")
+    def test_bounds_are_necessary(self) -> None:
+        rejected = 0
+        for _ in range(300):
+            blocks = self._generate_blocks(self.random.randint(1, 6), 40)
+            width, height = self.random.randint(20, 60), self.random.randint(20, 60)
+            sizes = [(block.width, block.height) for block in blocks]
+            reason = PackingBounds.check(width, height, sizes)
+            packers = [Binpacker(width, height), MaxRectsPacker(width, height), SkylinePacker(width, height)]
+            if reason is not None:
+                rejected += 1
+                self.assertFalse(any(packer.fittable(blocks, True) for packer in packers))
+        allure_details(f"Bounds rejected {rejected} of 300 instances")
+
+    @allure.sub_suite("Bounds")
+    def test_packer_reports_reason(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(20)]
+        for packer_type in (Binpacker, MaxRectsPacker, SkylinePacker):
+            packer = packer_type(100, 100)
+            self.assertFalse(packer.fit_blocks(buildings))
+            self.assertEqual((packer.status, packer.reason), (Binpacker.NOT_FITTED, PackingBounds.AREA_REASON))
+        allure_details(packer.reason)
+
+
+@allure.suite("ExactPackerTest")
+class ExactPackerTestCase(PackingTestCase):
+
+    @staticmethod
+    def __brute_force(width: int, height: int, blocks: typing.List[Block]) -> bool:
+        occupied = [[False] * width for _ in range(height)]
+        
+        def fill(x: int, y: int, block_width: int, block_height: int, value: bool) -> None:
+            for row in range(y, y + block_height):
+                occupied[row][x:x + block_width] = [value] * block_width
+        
+        def search(i: int) -> bool:
+            if i == len(blocks):
+                return True
+            for block_width, block_height in {(blocks[i].width, blocks[i].height), (blocks[i].height, blocks[i].width)}:
+                for y in range(height - block_height + 1):
+                    for x in range(width - block_width + 1):
+                        if any(any(occupied[row][x:x + block_width]) for row in range(y, y + block_height)):
+                            continue
+                        fill(x, y, block_width, block_height, True)
+                        if search(i + 1):
+                            return True
+                        fill(x, y, block_width, block_height, False)
+            return False
+        
+        return search(0)
+
+    @allure.sub_suite("Exact")
+    def test_exact_matches_brute_force(self) -> None:
+        for _ in range(150):
+            blocks = [
+                Block(str(self.random.randint(0, 2)), 0, self.random.randint(1, 4), self.random.randint(1, 4)) \
+                    for _ in range(self.random.randint(1, 5))
+            ]
+            width, height = self.random.randint(3, 7), self.random.randint(3, 7)
+            packer = ExactPacker(width, height)
+            fitted = packer.fittable(blocks)
+            self.assertNotEqual(packer.status, ExactPacker.UNKNOWN)
+            self.assertEqual(fitted, self.__brute_force(width, height, blocks))
+            if fitted:
+                self._check_placements(packer, blocks)
+        allure_details("Exact packer matched brute force on 150 instances")
+
+    @allure.sub_suite("Exact")
+    def test_exact_proves_infeasibility(self) -> None:
+        blocks = [Block("A", 0, 2, 2)] * 5
+        self.assertIsNone(PackingBounds.check(5, 5, [(block.width, block.height) for block in blocks]))
+        packer = ExactPacker(5, 5)
+        self.assertFalse(packer.fittable(blocks))
+        self.assertEqual(packer.status, ExactPacker.NOT_FITTED)
+        self.assertTrue(packer.fittable(blocks[:4]))
+        allure_details(f"Exact packer proved infeasibility in {packer.nodes} nodes")
+
+    @allure.sub_suite("Exact")
+    def test_exact_finds_what_heuristics_miss(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(2)]
+        buildings += [Kindergarten(length=Meter(50), width=Meter(40)) for _ in range(2)]
+        self.assertFalse(MaxRectsPacker(110, 130).fit_blocks(buildings))
+        self.assertFalse(SkylinePacker(110, 130).fit_blocks(buildings))
+        packer = ExactPacker(110, 130)
+        self.assertTrue(packer.fit_blocks(buildings))
+        self.assertEqual(packer.status, ExactPacker.FITTED)
+        # Упаковка из отсева MaxRects не тратит узлов перебора
+        self.assertGreater(packer.nodes, 0)
+        self._check_placements(packer, buildings)
+        allure_details(f"Exact stage fitted the blocks in {packer.nodes} nodes")
+
+    @allure.sub_suite("Exact")
+    def test_exact_fittable_beats_guillotine(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(20)]
+        self.assertFalse(Binpacker(290, 290).fit_blocks(buildings))
+        packer = ExactPacker(290, 290)
+        self.assertTrue(packer.fittable(packer._make_block(buildings)))
+        self.assertEqual(packer.status, ExactPacker.FITTED)
+        self.assertGreater(packer.nodes, 0)
+        self._check_placements(packer, buildings)
+
+    @allure.sub_suite("Exact")
+    def test_exact_keeps_search_contract(self) -> None:
+        # Перебор по угловым точкам не подменяет унаследованный _search
+        blocks = [Block("A", 0, 3, 2), Block("B", 0, 3, 3)]
+        packer = ExactPacker(5, 5)
+        self.assertTrue(packer._search([blocks]))
+        self.assertEqual(packer.status, ExactPacker.FITTED)
+        self._check_placements(packer, blocks)
+
+    @allure.sub_suite("Exact")
+    def test_exact_node_limit(self) -> None:
+        blocks = [Block(str(i), 0, 5 + i, 12 - i) for i in range(7)]
+        packer = ExactPacker(22, 22, node_limit=10)
+        self.assertFalse(packer.fittable(blocks))
+        self.assertEqual((packer.status, packer.nodes), (ExactPacker.UNKNOWN, 10))
+        
+        packer = ExactPacker(22, 22, node_limit=None)
+        self.assertFalse(packer.fittable(blocks))
+        self.assertEqual(packer.status, ExactPacker.NOT_FITTED)
+        allure_details(f"Exact packer proved infeasibility in {packer.nodes} nodes")
+
+
+@allure.suite("PackingCacheTest")
+class PackingCacheTestCase(PackingTestCase):
+
+    @allure.sub_suite("Cache")
+    def test_lru_eviction(self) -> None:
+        cache = PackingCache(maxsize=2)
+        cache.put("a", [("A", 0, 1, 1, 0, 0)])
+        cache.put("b", [("B", 0, 1, 1, 0, 0)])
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", [("C", 0, 1, 1, 0, 0)])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), [("A", 0, 1, 1, 0, 0)])
+        self.assertEqual((len(cache), cache.hits, cache.misses), (2, 2, 1))
+
+    @allure.sub_suite("Cache")
+    def test_key_is_canonical(self) -> None:
+        packer = Binpacker(10, 20)
+        blocks = [Block("A", 0, 2, 3), Block("B", 1, 4, 4)]
+        self.assertEqual(PackingCache.make_key(packer, blocks), PackingCache.make_key(packer, blocks[::-1]))
+        self.assertNotEqual(PackingCache.make_key(packer, blocks), PackingCache.make_key(Binpacker(20, 10), blocks))
+        self.assertNotEqual(PackingCache.make_key(packer, blocks), PackingCache.make_key(MaxRectsPacker(10, 20), blocks))
+
+    @allure.sub_suite("Cache")
+    def test_fit_and_persistence(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(4)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.json")
+            cache = PackingCache(path)
+            packer = Binpacker(200, 200)
+            self.assertTrue(cache.fit(packer, buildings))
+            self.assertEqual(cache.misses, 1)
+            
+            restored = PackingCache(path)
+            other = Binpacker(200, 200)
+            self.assertTrue(restored.fit(other, buildings[::-1]))
+            self.assertEqual((restored.hits, other.nodes), (1, 0))
+            self.assertEqual(other.placements, packer.placements)
+            
+            restored.clear()
+            self.assertFalse(os.path.exists(path))
+            self.assertFalse(restored.fit(Binpacker(100, 100), buildings))
+            self.assertEqual(len(restored), 0)
+        allure_details(f"Cached placements: {packer.placements}")
+
+
+@allure.suite("GridPackerTest")
+class GridPackerTestCase(PackingTestCase):
+
+    def __check_mask(self, packer: GridPacker) -> None:
+        for _, _, width, height, x, y in packer.placements:
+            self.assertFalse(packer.mask[y:y + height, x:x + width].any())
+
+    @allure.sub_suite("Grid")
+    def test_free_windows(self) -> None:
+        occupied = np.zeros((4, 5), dtype=bool)
+        occupied[1, 2] = True
+        free = GridPacker._free_windows(GridPacker._integral(occupied), 2, 2)
+        expected = np.ones((3, 4), dtype=bool)
+        expected[0:2, 1:3] = False
+        np.testing.assert_array_equal(free, expected)
+
+    @allure.sub_suite("Grid")
+    def test_grid_is_valid(self) -> None:
+        for _ in range(100):
+            blocks = self._generate_blocks(self.random.randint(1, 8), 30)
+            packer = GridPacker(self.random.randint(20, 80), self.random.randint(20, 80))
+            packer.add_cutout(self.random.randint(0, 15), self.random.randint(0, 15), 5, 5)
+            if packer.fittable(blocks):
+                self._check_placements(packer, blocks)
+                self.__check_mask(packer)
+            else:
+                self.assertEqual(packer.placements, list())
+
+    @allure.sub_suite("Grid")
+    def test_irregular_plot(self) -> None:
+        # Г-образный участок: правый верхний угол 6 x 6 застраивать нельзя
+        mask = np.zeros((10, 10), dtype=bool)
+        mask[4:, 4:] = True
+        packer = GridPacker(10, 10, mask)
+        self.assertEqual(packer.free_area, 64)
+        blocks = [Block("A", 0, 10, 4), Block("B", 4, 4, 6)]
+        self.assertTrue(packer.fittable(blocks))
+        self._check_placements(packer, blocks)
+        self.__check_mask(packer)
+        self.assertFalse(packer.fittable(blocks + [Block("C", 0, 5, 5)]))
+        allure_details(f"Placements on the L-shaped plot: {packer.placements}")
+
+    @allure.sub_suite("Grid")
+    def test_grid_buildings(self) -> None:
+        buildings = [School(length=Meter(40), width=Meter(70)) for _ in range(4)]
+        packer = GridPacker(200, 200)
+        packer.add_cutout(0, 0, 100, 100)
+        self.assertTrue(packer.fit_blocks(buildings))
+        self._check_placements(packer, buildings)
+        self.__check_mask(packer)
+        packer.add_cutout(0, 100, 200, 100)
+        self.assertFalse(packer.fit_blocks(buildings))
+
+    @allure.sub_suite("Validation")
+    def test_mask_shape(self) -> None:
+        with self.assertRaises(ValueError) as context:
+            GridPacker(10, 20, np.zeros((10, 20), dtype=bool))
+        allure_details(str(context.exception))
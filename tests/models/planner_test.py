@@ -0,0 +1,169 @@
+import allure
+import typing
+import unittest
+import itertools
+
+from .. import allure_details
+
+from src.measurement.length import Meter
+from src.measurement.money import Ruble
+from src.models.price import Price
+from src.models.surface import Surface
+from src.models.knapsack import BoundedKnapsack
+from src.models.buildings import Building, Apartment, School, Shop
+from src.models.placement import ExactPacker, PackingCache, StagedPacker
+from src.models.planner import PlacementPlanner
+
+
+__all__ = [
+    "PlacementPlannerTestCase",
+]
+
+
+@allure.suite("PlacementPlannerTest")
+class PlacementPlannerTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.apartment = Apartment()
+        cls.shop = Shop(length=Meter(70), width=Meter(60))
+        cls.profits = {
+            id(cls.apartment): float(cls.apartment.profit),
+            id(cls.shop): float(cls.shop.profit),
+        }
+        cls.budget = Price(Ruble(10_000_000_000))
+
+    def setUp(self) -> None:
+        self.school = School(length=Meter(40), width=Meter(70))
+        # Школа 80x50 и торговый центр 70x80 на участке 110x110
+        # по площади помещаются, но расположить их вместе нельзя
+        self.surface = Surface(Meter(110), Meter(110))
+        self.buildings = [self.school, self.apartment, self.shop]
+
+    def __profit(self, buildings: typing.List[Building]) -> float:
+        return sum(self.profits.get(id(building), 0.0) for building in buildings)
+
+    def __brute_force(self) -> float:
+        width, length = int(self.surface.width), int(self.surface.length)
+        best = None
+        for apartments, shops in itertools.product(range(5), range(2)):
+            solution = [self.school] + [self.apartment] * apartments + [self.shop] * shops
+            if sum(float(building.area_with_indent) for building in solution) > float(self.surface.area):
+                continue
+            if StagedPacker(width, length).fit_blocks(solution):
+                best = max(best or 0.0, self.__profit(solution))
+        return best
+
+    @allure.sub_suite("Planning")
+    def test_plan_is_most_profitable_fittable(self) -> None:
+        planner = PlacementPlanner(self.surface)
+        solution, packer = planner.plan(self.buildings, self.budget)
+
+        self.assertEqual(len(packer.placements), len(solution))
+        self.assertFalse(any(isinstance(building, Shop) for building in solution))
+        self.assertEqual(self.__profit(solution), self.__brute_force())
+        self.assertEqual(planner.unknown, 0)
+        allure_details(f"Plan {[str(building.title) for building in solution]} after {planner.packings} packings")
+
+    @allure.sub_suite("Planning")
+    def test_engines_agree(self) -> None:
+        solutions = list()
+        for engine in BoundedKnapsack.ENGINES:
+            planner = PlacementPlanner(self.surface, engine=engine)
+            solution, _ = planner.plan(self.buildings, self.budget)
+            solutions.append(self.__profit(solution))
+        self.assertEqual(len(set(solutions)), 1)
+
+    @allure.sub_suite("Planning")
+    def test_required_buildings_do_not_fit(self) -> None:
+        # Каждая школа проходит проверку по сторонам, и вместе они
+        # меньше участка по площади, но рядом не помещаются
+        surface = Surface(Meter(90), Meter(90))
+        buildings = [self.school, School(length=Meter(40), width=Meter(70))]
+        planner = PlacementPlanner(surface)
+
+        with self.assertRaises(ValueError) as context:
+            planner.plan(buildings, self.budget)
+        self.assertIn("Невозможно расположить", str(context.exception))
+        allure_details(str(context.exception))
+
+    @allure.sub_suite("Feasibility")
+    def test_heuristic_failure_is_not_a_proof(self) -> None:
+        planner = PlacementPlanner(self.surface)
+
+        self.assertIsNone(planner._fit([self.school, self.shop]))
+        self.assertEqual(planner.stages[StagedPacker.EXHAUSTIVE_STAGE], 1)
+        attempts = planner.packings + planner.rejected
+
+        self.assertIsNone(planner._fit([self.shop, self.school]))
+        self.assertEqual(planner.packings + planner.rejected, attempts)
+        self.assertEqual(planner.cache_hits, 1)
+
+        # Отказ полного перебора Binpacker не доказан, и надмножество
+        # проверяется заново, а не отсекается
+        planner._fit([self.shop, self.school, self.apartment])
+        self.assertEqual(planner.pruned, 0)
+        self.assertEqual(planner.packings + planner.rejected, attempts + 1)
+
+    @allure.sub_suite("Feasibility")
+    def test_superset_of_rejected_is_pruned(self) -> None:
+        surface = Surface(Meter(90), Meter(90))
+        planner = PlacementPlanner(surface)
+        schools = [self.school, School(length=Meter(40), width=Meter(70))]
+
+        self.assertIsNone(planner._fit(schools))
+        self.assertEqual((planner.rejected, planner.pruned), (1, 0))
+
+        self.assertIsNone(planner._fit(schools + [self.apartment]))
+        self.assertEqual((planner.rejected, planner.pruned), (1, 1))
+
+    @allure.sub_suite("Feasibility")
+    def test_superset_of_exact_failure_is_pruned(self) -> None:
+        planner = PlacementPlanner(self.surface, packer_type=ExactPacker)
+
+        self.assertIsNone(planner._fit([self.school, self.shop]))
+        self.assertEqual((planner.packings, planner.pruned), (1, 0))
+
+        self.assertIsNone(planner._fit([self.shop, self.school, self.apartment]))
+        self.assertEqual((planner.packings, planner.pruned), (1, 1))
+
+    @allure.sub_suite("Feasibility")
+    def test_memo_hit(self) -> None:
+        planner = PlacementPlanner(self.surface)
+
+        first = planner._fit([self.school, self.apartment])
+        second = planner._fit([self.apartment, self.school])
+
+        self.assertIsNotNone(first)
+        self.assertEqual(second.placements, first.placements)
+        self.assertEqual(planner.packings, 1)
+        self.assertEqual(planner.cache_hits, 1)
+
+    @allure.sub_suite("Feasibility")
+    def test_cache_hit(self) -> None:
+        cache = PackingCache()
+        PlacementPlanner(self.surface, cache=cache)._fit([self.school, self.apartment])
+
+        planner = PlacementPlanner(self.surface, cache=cache)
+        packer = planner._fit([self.school, self.apartment])
+
+        self.assertIsNotNone(packer)
+        self.assertEqual(planner.packings, 0)
+        self.assertEqual(planner.cache_hits, 1)
+
+    @allure.sub_suite("Feasibility")
+    def test_stages_are_counted(self) -> None:
+        planner = PlacementPlanner(self.surface)
+
+        self.assertIsNotNone(planner._fit([self.school, self.apartment]))
+        self.assertEqual(planner.stages, {StagedPacker.SKYLINE_STAGE: 1})
+        self.assertIsNone(planner._fit([self.school, self.shop]))
+        self.assertEqual(planner.stages, {StagedPacker.SKYLINE_STAGE: 1, StagedPacker.EXHAUSTIVE_STAGE: 1})
+        self.assertEqual(sum(planner.stages.values()), planner.packings)
+        allure_details(f"Stages: {dict(planner.stages)}")
+
+    @allure.sub_suite("Validation")
+    def test_invalid_engine(self) -> None:
+        with self.assertRaises(ValueError) as context:
+            PlacementPlanner(self.surface, engine="fortran")
+        allure_details(str(context.exception))
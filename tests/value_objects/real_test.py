@@ -3,11 +3,15 @@ import allure
 import typing
 import unittest
 import operator
+import threading
+
+from fractions import Fraction
 
 from .. import allure_details, random_shuffle
+from src import _validation_operation
 from src.constants import OPERATORS
 
-from src.validators import NUMBER_TYPES
+from src.validators import NUMBER_TYPES, ValidationCounter, validation_disabled
 from src.value_objects.real import Real
 
 
@@ -253,4 +257,75 @@ class RealTestCase(unittest.TestCase):
     
     @allure.sub_suite("__rmod__")
     def test_rmod(self) -> None:
-        self.__math(operator.mod, OPERATORS[operator.mod])
\ No newline at end of file
+        self.__math(operator.mod, OPERATORS[operator.mod])
+        
+    @allure.sub_suite("Fast path")
+    def test_fast_path_skips_validation(self) -> None:
+        right, left = Real(7), Real(2.5)
+        
+        with ValidationCounter() as validated:
+            Real(_validation_operation(right, left, operator.add, Real))
+            Real(_validation_operation(right, 3, operator.mul, Real))
+            _validation_operation(right, left, operator.lt, Real)
+        
+        with ValidationCounter() as fast:
+            self.assertEqual((right + left).value, 9.5)
+            self.assertEqual((right * 3).value, 21)
+            self.assertFalse(right < left)
+        
+        self.assertEqual(fast.total, 0)
+        self.assertEqual(validated.calls["_validate"], 3)
+        self.assertEqual(validated.calls["NumberValidator"], 2)
+        allure_details(f"Validated: {validated.total} calls, fast: {fast.total} calls")
+        
+    @allure.sub_suite("Fast path")
+    def test_fast_path_falls_back(self) -> None:
+        self.assertIsInstance((Real(1) + Real(0.5)).value, float)
+        with self.assertRaises(ValueError):
+            Real(10 ** 99) * 100
+        with self.assertRaises(TypeError):
+            Real(-1) ** 0.5
+        with self.assertRaises(TypeError):
+            Real(1) + "1"
+        
+    @allure.sub_suite("Validation counter")
+    def test_validation_counter(self) -> None:
+        with ValidationCounter() as counter:
+            Real(1)
+            with ValidationCounter() as inner:
+                Real(Fraction(1, 2)) + Fraction(1, 3)
+            Real(2) + Real(3)
+        self.assertEqual(inner.calls["_validate"], 1)
+        self.assertEqual(inner.calls["NumberValidator"], 2)
+        self.assertEqual(counter.calls["NumberValidator"], 5)
+        self.assertEqual(counter.total, 6)
+        
+        Real(1)
+        self.assertEqual(counter.total, 6)
+        allure_details(f"Validator calls: {dict(counter.calls)}")
+        
+    @allure.sub_suite("Trusted mode")
+    def test_validation_disabled(self) -> None:
+        value = 10 ** 101
+        results = list()
+        
+        def initialize() -> None:
+            try:
+                Real(value)
+                results.append(None)
+            except ValueError as error:
+                results.append(error)
+        
+        with ValidationCounter() as counter:
+            with validation_disabled():
+                real = Real(value) + Real(Fraction(1, 2))
+                thread = threading.Thread(target=initialize)
+                thread.start()
+                thread.join()
+        self.assertEqual(real.value, value + Fraction(1, 2))
+        self.assertEqual(counter.total, 0)
+        self.assertIsInstance(results[0], ValueError)
+        
+        with self.assertRaises(ValueError):
+            Real(value)
+        allure_details(f"Trusted Real: {real.value}, other thread: {results[0]!r}")